@@ -1,12 +1,15 @@
+from PySide6.QtWidgets import QApplication
 from ui.main_window import MainWindow
 from backend.controllers.tle_controller import TLEController
 from backend.controllers.login_controller import LoginController
+from backend.tle.archive import TLEArchive
 
 
 class AppController:
     def __init__(self):
         self.main_window = MainWindow()
-        self.tle_controller = TLEController()
+        self.tle_controller = TLEController(TLEArchive())
+        QApplication.instance().aboutToQuit.connect(self.tle_controller.close)
         self.login_controller = LoginController(self.main_window)
         
         from backend.controllers.propagator_controller import PropagatorController
@@ -17,11 +20,13 @@ class AppController:
 
         self._connect_signals()
         self._update_login_menu()
+        self.tle_controller.restore_archive()
 
     def _connect_signals(self):
         # TLE loading signals
         self.main_window.load_tle_requested.connect(self.tle_controller.load_tle)
         self.main_window.load_spacetrack_tle_requested.connect(self.tle_controller.load_spacetrack_tle)
+        self.main_window.sync_spacetrack_requested.connect(self._on_sync_spacetrack_requested)
         self.main_window.rename_requested.connect(self.tle_controller.rename_satellite)
         self.main_window.table_requested.connect(self.tle_controller.get_satellite_data)
         self.main_window.plot_requested.connect(self.tle_controller.get_satellite_plot_data)
@@ -34,6 +39,7 @@ class AppController:
         self.tle_controller.satellite_removed.connect(self.main_window.remove_satellite)
         self.tle_controller.satellite_data_ready.connect(self.main_window.show_satellite_table)
         self.tle_controller.satellite_plot_ready.connect(self.main_window.show_satellite_plot)
+        self.tle_controller.archive_write_failed.connect(self.main_window.show_archive_error)
         
         self.main_window.propagate_requested.connect(self.propagator_controller.propagate_satellite)
         self.propagator_controller.propagation_data_ready.connect(
@@ -58,9 +64,16 @@ class AppController:
         self.login_controller.update_menu_state(
             self.main_window.login_action,
             self.main_window.logout_action,
-            self.main_window.insert_spacetrack
+            self.main_window.insert_spacetrack,
+            self.main_window.sync_spacetrack
         )
     
+    def _on_sync_spacetrack_requested(self):
+        since_epochs = self.tle_controller.get_latest_epochs()
+        tle_data = self.main_window.open_sync_dialog(since_epochs)
+        if tle_data:
+            self.tle_controller.sync_spacetrack_tle(tle_data, since_epochs)
+    
     def _on_login_status_changed(self, logged_in):
         """Handle login status changes."""
         self._update_login_menu()
@@ -0,0 +1,74 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from backend.propagator.trajectory_cache import ComputationCancelled
+from threading import Event
+
+
+class ComputeJobSignals(QObject):
+    progress = Signal(int)
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+    done = Signal(object)
+
+
+class ComputeJob(QRunnable):
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = ComputeJobSignals()
+        self._cancel_event = Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def run(self):
+        try:
+            result = self.fn(
+                *self.args,
+                progress_callback=self.signals.progress.emit,
+                is_cancelled=self.is_cancelled,
+                **self.kwargs
+            )
+            if self.is_cancelled():
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(result)
+        except ComputationCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            self.signals.done.emit(self)
+
+
+class ComputeService(QObject):
+    # Forwards every job's failure, connected before the job can run.
+    failed = Signal(str)
+
+    def __init__(self, max_threads=None):
+        super().__init__()
+        self.pool = QThreadPool()
+        if max_threads is not None:
+            self.pool.setMaxThreadCount(max_threads)
+        self._jobs = set()
+
+    def submit(self, fn, *args, **kwargs):
+        job = ComputeJob(fn, *args, **kwargs)
+        job.signals.done.connect(self._release_job)
+        job.signals.failed.connect(self.failed)
+        self._jobs.add(job)
+        self.pool.start(job)
+        return job
+
+    def cancel_all(self):
+        for job in list(self._jobs):
+            job.cancel()
+
+    def _release_job(self, job):
+        self._jobs.discard(job)
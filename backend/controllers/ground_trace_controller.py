@@ -1,6 +1,8 @@
 from PySide6.QtCore import QObject, Signal
-from backend.propagator.sgp4_propagator import propagate_orbit, get_orbital_period_minutes
-from backend.propagator.coordinate_converter import convert_trajectory
+from backend.propagator.sgp4_propagator import get_orbital_period_minutes
+from backend.propagator.trajectory_cache import get_geodetic_trajectory
+from backend.propagator.trace_geometry import assign_segments, build_trace_segments
+from backend.controllers.compute_service import ComputeService
 from datetime import datetime, timedelta
 
 
@@ -10,14 +12,12 @@ class GroundTraceController(QObject):
     def __init__(self, tle_controller):
         super().__init__()
         self.tle_controller = tle_controller
+        self.compute_service = ComputeService()
     
     def initiate_ground_trace(self, satellite_id):
-        if satellite_id not in self.tle_controller.satellites:
-            return
-        
-        satellite = self.tle_controller.satellites[satellite_id]
+        satellite = self.tle_controller.get_satellite(satellite_id)
         
-        if not satellite.tle_lines or len(satellite.tle_lines) == 0:
+        if satellite is None or not satellite.tle_lines:
             return
         
         latest_tle = satellite.tle_lines[-1]
@@ -38,16 +38,25 @@ class GroundTraceController(QObject):
         
         self.ground_trace_data_ready.emit(satellite_id, satellite.name, ground_trace_data)
     
-    def compute_ground_trace(self, tle_line1, tle_line2, start_time, stop_time, 
+    def submit_ground_trace(self, tle_line1, tle_line2, start_time, stop_time,
                             interval1_minutes, interval2_minutes, step_seconds=60):
-        
-        result = propagate_orbit(tle_line1, tle_line2, start_time, stop_time, step_seconds)
-        
-        latitudes, longitudes, altitudes = convert_trajectory(
-            result['times'],
+        return self.compute_service.submit(
+            self.compute_ground_trace,
             tle_line1,
-            tle_line2
+            tle_line2,
+            start_time,
+            stop_time,
+            interval1_minutes,
+            interval2_minutes,
+            step_seconds=step_seconds
         )
+    
+    def compute_ground_trace(self, tle_line1, tle_line2, start_time, stop_time, 
+                            interval1_minutes, interval2_minutes, step_seconds=60,
+                            progress_callback=None, is_cancelled=None):
+        
+        trajectory = get_geodetic_trajectory(tle_line1, tle_line2, start_time, stop_time, step_seconds,
+                                             progress_callback, is_cancelled)
         
         midpoint_time = start_time + (stop_time - start_time) / 2
         
@@ -57,47 +66,20 @@ class GroundTraceController(QObject):
         segment1_end = midpoint_time - interval1_delta
         segment2_end = midpoint_time + interval2_delta
         
-        segments = self._categorize_segments(
-            result['times'], 
-            segment1_end, 
-            segment2_end
-        )
+        segments = assign_segments(trajectory.epochs, segment1_end, segment2_end)
+        trace_lines, trace_segments = build_trace_segments(trajectory.longitudes, trajectory.latitudes, segments)
         
-        midpoint_index = self._find_closest_time_index(result['times'], midpoint_time)
+        midpoint_index = trajectory.find_index(midpoint_time)
         
         return {
-            'times': result['times'],
-            'latitudes': latitudes,
-            'longitudes': longitudes,
-            'altitudes': altitudes,
+            'trajectory': trajectory,
             'segments': segments,
+            'trace_lines': trace_lines,
+            'trace_segments': trace_segments,
             'midpoint_index': midpoint_index,
             'midpoint_time': midpoint_time
         }
     
-    def _categorize_segments(self, times, segment1_end, segment2_end):
-        segments = []
-        for time in times:
-            if time < segment1_end:
-                segments.append(0)
-            elif time <= segment2_end:
-                segments.append(1)
-            else:
-                segments.append(2)
-        return segments
-    
-    def _find_closest_time_index(self, times, target_time):
-        min_diff = None
-        closest_index = 0
-        
-        for i, time in enumerate(times):
-            diff = abs((time - target_time).total_seconds())
-            if min_diff is None or diff < min_diff:
-                min_diff = diff
-                closest_index = i
-        
-        return closest_index
-    
     def parse_time_input(self, time_str):
         time_str = time_str.strip()
         
@@ -113,5 +95,8 @@ class GroundTraceController(QObject):
         
         return None
     
-    def find_time_index(self, times, target_time):
-        return self._find_closest_time_index(times, target_time)
+    def find_time_index(self, trajectory, target_time):
+        return trajectory.find_index(target_time)
+    
+    def interpolate_position(self, trajectory, target_time):
+        return trajectory.interpolate(target_time)
@@ -1,6 +1,7 @@
 from PySide6.QtWidgets import QMessageBox
 from PySide6.QtCore import QObject, Signal
 from backend.utils.auth_config import AuthConfig
+from backend.utils.spacetrack import SpaceTrackSessionManager
 from ui.dialogs.login_dialog import LoginDialog
 
 
@@ -48,6 +49,7 @@ class LoginController(QObject):
 
         if reply == QMessageBox.StandardButton.Yes:
             self.auth_config.clear_credentials()
+            SpaceTrackSessionManager().logout()
             self.login_status_changed.emit(False)
             QMessageBox.information(
                 self.parent,
@@ -55,11 +57,14 @@ class LoginController(QObject):
                 "Successfully logged out from Space-Track."
             )
 
-    def update_menu_state(self, login_action, logout_action, spacetrack_insert_action):
+    def update_menu_state(self, login_action, logout_action, spacetrack_insert_action,
+                          spacetrack_sync_action=None):
         login_action.setText(self.get_login_display_text())
         login_action.setEnabled(not self.get_login_status())
         logout_action.setVisible(self.should_show_logout())
         spacetrack_insert_action.setEnabled(self.should_enable_spacetrack_insert())
+        if spacetrack_sync_action is not None:
+            spacetrack_sync_action.setEnabled(self.should_enable_spacetrack_insert())
 
     def open_login_dialog(self):
         if self.login_dialog is None:
@@ -1,6 +1,8 @@
 from PySide6.QtCore import QObject, Signal
-from backend.propagator.sgp4_propagator import propagate_orbit
-from backend.propagator.coordinate_converter import convert_trajectory
+from backend.propagator.sgp4_propagator import propagate_catalog, get_orbital_period_minutes
+from backend.propagator.trajectory_cache import get_geodetic_trajectory
+from backend.propagator.adaptive_sampling import get_adaptive_trajectory
+from backend.controllers.compute_service import ComputeService
 from datetime import datetime, timedelta
 import re
 
@@ -11,14 +13,12 @@ class PropagatorController(QObject):
     def __init__(self, tle_controller):
         super().__init__()
         self.tle_controller = tle_controller
+        self.compute_service = ComputeService()
     
     def propagate_satellite(self, satellite_id):
-        if satellite_id not in self.tle_controller.satellites:
-            return
-        
-        satellite = self.tle_controller.satellites[satellite_id]
+        satellite = self.tle_controller.get_satellite(satellite_id)
         
-        if not satellite.tle_lines or len(satellite.tle_lines) == 0:
+        if satellite is None or not satellite.tle_lines:
             return
         
         latest_tle = satellite.tle_lines[-1]
@@ -36,22 +36,55 @@ class PropagatorController(QObject):
         
         self.propagation_data_ready.emit(satellite_id, satellite.name, propagation_data)
     
-    def compute_trajectory(self, tle_line1, tle_line2, start_time, stop_time_str, step_seconds=60):
-        stop_time = self._parse_stop_time(start_time, stop_time_str)
-        
-        result = propagate_orbit(tle_line1, tle_line2, start_time, stop_time, step_seconds)
-        
-        latitudes, longitudes, altitudes = convert_trajectory(
-            result['times'],
+    def submit_trajectory(self, tle_line1, tle_line2, start_time, stop_time_str, step_seconds=60,
+                          adaptive=False):
+        return self.compute_service.submit(
+            self.compute_trajectory,
             tle_line1,
-            tle_line2
+            tle_line2,
+            start_time,
+            stop_time_str,
+            step_seconds=step_seconds,
+            adaptive=adaptive
         )
+    
+    def compute_trajectory(self, tle_line1, tle_line2, start_time, stop_time_str, step_seconds=60,
+                           adaptive=False, progress_callback=None, is_cancelled=None):
+        stop_time = self._parse_stop_time(start_time, stop_time_str)
         
+        if adaptive:
+            period_minutes = get_orbital_period_minutes(tle_line1, tle_line2)
+            return get_adaptive_trajectory(tle_line1, tle_line2, start_time, stop_time, period_minutes,
+                                           progress_callback=progress_callback, is_cancelled=is_cancelled)
+        
+        return get_geodetic_trajectory(tle_line1, tle_line2, start_time, stop_time, step_seconds,
+                                       progress_callback, is_cancelled)
+    
+    def compute_catalog_trajectories(self, start_time, stop_time, step_seconds=60, satellite_ids=None):
+        if satellite_ids is None:
+            satellite_ids = list(self.tle_controller.satellites.keys())
+
+        propagated_ids = []
+        tle_pairs = []
+        for satellite_id in satellite_ids:
+            satellite = self.tle_controller.get_satellite(satellite_id)
+            if satellite is None or not satellite.tle_lines:
+                continue
+            propagated_ids.append(satellite_id)
+            tle_pairs.append(satellite.tle_lines[-1])
+
+        if not tle_pairs:
+            return None
+
+        result = propagate_catalog(tle_pairs, start_time, stop_time, step_seconds)
+
         return {
-            'times': result['times'],
-            'latitudes': latitudes,
-            'longitudes': longitudes,
-            'altitudes': altitudes
+            'satellite_ids': propagated_ids,
+            'start_time': start_time,
+            'offsets': result['offsets'],
+            'positions': result['positions'],
+            'velocities': result['velocities'],
+            'errors': result['errors']
         }
     
     def _parse_stop_time(self, start_time, stop_time_str):
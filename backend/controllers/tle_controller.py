@@ -1,7 +1,9 @@
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QFileDialog
-from backend.tle.parser import parse_tle_file
+from backend.tle.parser import parse_tle_catalog, parse_tle_text, parse_tle_updates
+from backend.controllers.compute_service import ComputeService
 from data.satellite import SatelliteData
+import pandas as pd
 import uuid
 
 
@@ -11,105 +13,155 @@ class TLEController(QObject):
     satellite_removed = Signal(str)
     satellite_data_ready = Signal(str, str, object)
     satellite_plot_ready = Signal(str, str, object)
+    archive_write_failed = Signal(str)
 
-    def __init__(self):
+    def __init__(self, archive=None):
         super().__init__()
         self.satellites = {}
+        self.archive = archive
+        # Archive writes run in order on a single worker thread.
+        self.archive_writer = ComputeService(max_threads=1)
+        self.archive_writer.failed.connect(self.archive_write_failed)
+
+    def restore_archive(self):
+        if self.archive is None:
+            return
+
+        # One satellite per archived NORAD ID, even if it was loaded from
+        # several sources before.
+        for norad_id, name in self.archive.list_objects():
+            self._register_satellite(norad_id, name, None, None)
+
+    def get_satellite(self, satellite_id):
+        satellite = self.satellites.get(satellite_id)
+
+        if satellite is not None and satellite.dataframe is None and self.archive is not None:
+            # Queued writes, such as a sync's new records, must land first or
+            # the stale history would be cached for the rest of the session.
+            self.archive_writer.pool.waitForDone()
+            result = self.archive.load_object(satellite.norad_id)
+            satellite.dataframe = result['dataframe']
+            satellite.tle_lines = result['tle_lines']
+
+        return satellite
 
     def load_tle(self, filepath):
-        result = parse_tle_file(filepath)
+        self._add_satellites(parse_tle_catalog(filepath))
+
+    def _add_satellites(self, results):
+        self._write_archive('append_many',
+                            [(result['norad_id'], result['dataframe'], result['tle_lines'], None)
+                             for result in results])
+
+        for result in results:
+            self._register_satellite(result['norad_id'], result['norad_id'],
+                                     result['dataframe'], result['tle_lines'])
+
+    def _register_satellite(self, norad_id, name, dataframe, tle_lines):
         satellite_id = str(uuid.uuid4())
 
         satellite = SatelliteData(
             satellite_id=satellite_id,
-            norad_id=result['norad_id'],
-            name=result['norad_id'],
-            dataframe=result['dataframe'],
-            tle_lines=result['tle_lines']
+            norad_id=norad_id,
+            name=name,
+            dataframe=dataframe,
+            tle_lines=tle_lines
         )
 
         self.satellites[satellite_id] = satellite
         self.satellite_added.emit(satellite)
+        return satellite
+
+    def _write_archive(self, method, *args):
+        if self.archive is not None:
+            self.archive_writer.submit(self._run_archive_write, self.archive, method, *args)
+
+    def _run_archive_write(self, archive, method, *args, progress_callback=None, is_cancelled=None):
+        getattr(archive, method)(*args)
+        archive.commit()
+
+    def close(self):
+        self.archive_writer.pool.waitForDone()
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
 
     def rename_satellite(self, satellite_id, new_name):
         if satellite_id in self.satellites:
-            self.satellites[satellite_id].name = new_name
+            satellite = self.satellites[satellite_id]
+            satellite.name = new_name
+            self._write_archive('rename', satellite.norad_id, new_name)
             self.satellite_renamed.emit(satellite_id, new_name)
 
     def delete_satellite(self, satellite_id):
         if satellite_id in self.satellites:
-            del self.satellites[satellite_id]
+            satellite = self.satellites.pop(satellite_id)
+            still_loaded = any(s.norad_id == satellite.norad_id for s in self.satellites.values())
+            if not still_loaded:
+                self._write_archive('hide', satellite.norad_id)
             self.satellite_removed.emit(satellite_id)
 
     def get_satellite_data(self, satellite_id):
-        if satellite_id in self.satellites:
-            satellite = self.satellites[satellite_id]
+        satellite = self.get_satellite(satellite_id)
+        if satellite is not None:
             self.satellite_data_ready.emit(satellite_id, satellite.name, satellite.dataframe)
     
     def get_satellite_plot_data(self, satellite_id):
-        if satellite_id in self.satellites:
-            satellite = self.satellites[satellite_id]
+        satellite = self.get_satellite(satellite_id)
+        if satellite is not None:
             self.satellite_plot_ready.emit(satellite_id, satellite.name, satellite.dataframe)
     
     def load_spacetrack_tle(self, tle_data):
-        import tempfile
-        import os
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as temp_file:
-            temp_file.write(tle_data)
-            temp_filepath = temp_file.name
-        
-        try:
-            lines = tle_data.strip().split('\n')
-            norad_groups = {}
-            
-            for i in range(0, len(lines), 2):
-                if i + 1 >= len(lines):
-                    break
-                
-                line1 = lines[i][:69]
-                line2 = lines[i + 1][:69]
-                
-                norad_id_raw = line1[2:7].strip()
-                norad_id = str(int(norad_id_raw))
-                
-                if norad_id not in norad_groups:
-                    norad_groups[norad_id] = []
-                norad_groups[norad_id].append((line1, line2))
-            
-            for norad_id, tle_lines in norad_groups.items():
-                tle_text = '\n'.join([f"{l1}\n{l2}" for l1, l2 in tle_lines])
-                
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as obj_file:
-                    obj_file.write(tle_text)
-                    obj_filepath = obj_file.name
-                
-                try:
-                    result = parse_tle_file(obj_filepath)
-                    satellite_id = str(uuid.uuid4())
-
-                    satellite = SatelliteData(
-                        satellite_id=satellite_id,
-                        norad_id=norad_id,
-                        name=norad_id,
-                        dataframe=result['dataframe'],
-                        tle_lines=result['tle_lines']
-                    )
-
-                    self.satellites[satellite_id] = satellite
-                    self.satellite_added.emit(satellite)
-                finally:
-                    if os.path.exists(obj_filepath):
-                        os.remove(obj_filepath)
-        finally:
-            if os.path.exists(temp_filepath):
-                os.remove(temp_filepath)
+        if isinstance(tle_data, (str, bytes)):
+            self._add_satellites(parse_tle_text(tle_data))
+        else:
+            self._add_satellites(list(tle_data))
+
+    def get_latest_epochs(self):
+        latest = self.archive.latest_epochs() if self.archive is not None else {}
+
+        for satellite in self.satellites.values():
+            if satellite.dataframe is None or satellite.dataframe.empty:
+                continue
+            epoch = satellite.dataframe['time'].max().to_pydatetime()
+            if satellite.norad_id not in latest or epoch > latest[satellite.norad_id]:
+                latest[satellite.norad_id] = epoch
+
+        loaded = {satellite.norad_id for satellite in self.satellites.values()}
+        return {norad_id: epoch for norad_id, epoch in latest.items() if norad_id in loaded}
+
+    def sync_spacetrack_tle(self, tle_data, since_epochs=None):
+        if since_epochs is None:
+            since_epochs = self.get_latest_epochs()
+
+        if isinstance(tle_data, (str, bytes)):
+            results = parse_tle_updates(tle_data, since_epochs)
+        else:
+            results = list(tle_data)
+        if not results:
+            return
+
+        self._write_archive('append_many',
+                            [(result['norad_id'], result['dataframe'], result['tle_lines'], None)
+                             for result in results])
+
+        updates = {result['norad_id']: result for result in results}
+        for satellite in self.satellites.values():
+            result = updates.get(satellite.norad_id)
+            # Satellites not loaded yet pick the new records up from the archive.
+            if result is None or satellite.dataframe is None:
+                continue
+
+            satellite.dataframe = pd.concat(
+                [satellite.dataframe, result['dataframe']], ignore_index=True
+            )
+            satellite.tle_lines = (satellite.tle_lines or []) + result['tle_lines']
     
     def export_csv(self, satellite_id):
-        if satellite_id not in self.satellites:
+        satellite = self.get_satellite(satellite_id)
+        if satellite is None:
             return
         
-        satellite = self.satellites[satellite_id]
         filepath, _ = QFileDialog.getSaveFileName(
             None,
             "Export as CSV",
@@ -123,11 +175,8 @@ class TLEController(QObject):
         satellite.dataframe.to_csv(filepath, index=False)
     
     def export_tle(self, satellite_id, extension):
-        if satellite_id not in self.satellites:
-            return
-        
-        satellite = self.satellites[satellite_id]
-        if not satellite.tle_lines:
+        satellite = self.get_satellite(satellite_id)
+        if satellite is None or not satellite.tle_lines:
             return
         
         filter_str = f"TLE Files (*{extension})"
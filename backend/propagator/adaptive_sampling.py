@@ -0,0 +1,107 @@
+from backend.propagator.sgp4_propagator import build_offsets, propagate_offsets, build_epochs
+from backend.propagator.coordinate_converter import teme_to_geodetic
+from backend.propagator.trajectory_cache import TrajectoryCache, ComputationCancelled
+from backend.propagator.trajectory import Trajectory
+import numpy as np
+
+
+DEFAULT_TOLERANCE_DEGREES = 0.05
+SAMPLES_PER_ORBIT = 16
+MIN_STEP_SECONDS = 1.0
+MAX_REFINEMENTS = 16
+
+
+def _geodetic(tle_line1, tle_line2, start_time, offsets):
+    result = propagate_offsets(tle_line1, tle_line2, start_time, offsets)
+    valid = result['errors'] == 0
+
+    latitudes, longitudes, altitudes = teme_to_geodetic(
+        start_time,
+        offsets[valid],
+        result['positions'][valid],
+        result['velocities'][valid]
+    )
+    return valid, latitudes, longitudes, altitudes
+
+
+def _wrap_longitude(degrees):
+    return (degrees + 180.0) % 360.0 - 180.0
+
+
+def _chord_error(lat0, lon0, lat1, lon1, latm, lonm):
+    # Distance, in degrees, between the true ground-track midpoint and the
+    # midpoint of the straight line the map would draw between the ends.
+    chord_lon = lon0 + _wrap_longitude(lon1 - lon0) / 2.0
+    dlon = _wrap_longitude(lonm - chord_lon) * np.cos(np.radians(latm))
+    dlat = latm - (lat0 + lat1) / 2.0
+    return np.hypot(dlat, dlon)
+
+
+def compute_adaptive_trajectory(tle_line1, tle_line2, start_time, stop_time, period_minutes,
+                                tolerance_degrees=DEFAULT_TOLERANCE_DEGREES,
+                                progress_callback=None, is_cancelled=None):
+    span_seconds = (stop_time - start_time).total_seconds()
+    base_step = max(min(period_minutes * 60.0 / SAMPLES_PER_ORBIT, span_seconds), MIN_STEP_SECONDS)
+
+    offsets = build_offsets(start_time, stop_time, base_step)
+    if len(offsets) and offsets[-1] < span_seconds:
+        offsets = np.append(offsets, span_seconds)
+
+    valid, latitudes, longitudes, altitudes = _geodetic(tle_line1, tle_line2, start_time, offsets)
+    offsets = offsets[valid]
+
+    # Bisect every interval whose chord strays from the ground track by more
+    # than the tolerance; accepted intervals are never revisited.
+    pending = np.arange(max(len(offsets) - 1, 0))
+    for refinement in range(MAX_REFINEMENTS):
+        if is_cancelled is not None and is_cancelled():
+            raise ComputationCancelled()
+
+        pending = pending[offsets[pending + 1] - offsets[pending] >= 2 * MIN_STEP_SECONDS]
+        if len(pending) == 0:
+            break
+
+        midpoints = (offsets[pending] + offsets[pending + 1]) / 2.0
+        valid, mid_lats, mid_lons, mid_alts = _geodetic(tle_line1, tle_line2, start_time, midpoints)
+        pending = pending[valid]
+
+        errors = _chord_error(latitudes[pending], longitudes[pending],
+                              latitudes[pending + 1], longitudes[pending + 1],
+                              mid_lats, mid_lons)
+        refine = errors > tolerance_degrees
+        pending = pending[refine]
+
+        positions = pending + 1
+        offsets = np.insert(offsets, positions, midpoints[valid][refine])
+        latitudes = np.insert(latitudes, positions, mid_lats[refine])
+        longitudes = np.insert(longitudes, positions, mid_lons[refine])
+        altitudes = np.insert(altitudes, positions, mid_alts[refine])
+
+        # Both halves of each split interval are checked next round.
+        left = pending + np.arange(len(pending))
+        pending = np.sort(np.concatenate((left, left + 1)))
+
+        if progress_callback is not None:
+            progress_callback(int(100 * (refinement + 1) / MAX_REFINEMENTS))
+
+    if progress_callback is not None:
+        progress_callback(100)
+
+    return Trajectory(build_epochs(start_time, offsets),
+                      latitudes=latitudes, longitudes=longitudes, altitudes=altitudes)
+
+
+def get_adaptive_trajectory(tle_line1, tle_line2, start_time, stop_time, period_minutes,
+                            tolerance_degrees=DEFAULT_TOLERANCE_DEGREES,
+                            progress_callback=None, is_cancelled=None):
+    cache = TrajectoryCache()
+    step = ('adaptive', tolerance_degrees)
+
+    trajectory = cache.get(tle_line1, tle_line2, start_time, stop_time, step)
+    if trajectory is not None:
+        return trajectory
+
+    trajectory = compute_adaptive_trajectory(tle_line1, tle_line2, start_time, stop_time, period_minutes,
+                                             tolerance_degrees, progress_callback, is_cancelled)
+    cache.put(tle_line1, tle_line2, start_time, stop_time, step, trajectory)
+    return trajectory
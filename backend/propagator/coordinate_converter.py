@@ -1,22 +1,44 @@
-from skyfield.api import EarthSatellite, load, wgs84
+from skyfield.sgp4lib import TEME_to_ITRF
+from backend.propagator.satrec_cache import get_timescale
 import numpy as np
 
 
-def convert_trajectory(times, tle_line1, tle_line2):
-    ts = load.timescale()
-    satellite = EarthSatellite(tle_line1, tle_line2, ts=ts)
-    
-    latitudes = []
-    longitudes = []
-    altitudes = []
-    
-    for time in times:
-        t = ts.utc(time.year, time.month, time.day, time.hour, time.minute, time.second)
-        geocentric = satellite.at(t)
-        subpoint = wgs84.subpoint(geocentric)
-        
-        latitudes.append(subpoint.latitude.degrees)
-        longitudes.append(subpoint.longitude.degrees)
-        altitudes.append(subpoint.elevation.km)
-    
-    return np.array(latitudes), np.array(longitudes), np.array(altitudes)
+WGS84_RADIUS_KM = 6378.137
+WGS84_INVERSE_FLATTENING = 298.257223563
+
+_WGS84_E2 = (2.0 - 1.0 / WGS84_INVERSE_FLATTENING) / WGS84_INVERSE_FLATTENING
+
+
+def teme_to_geodetic(start_time, offsets, positions, velocities):
+    if len(offsets) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty.copy(), empty.copy()
+
+    ts = get_timescale()
+    seconds = start_time.second + start_time.microsecond * 1e-6 + np.asarray(offsets)
+    t = ts.utc(start_time.year, start_time.month, start_time.day,
+               start_time.hour, start_time.minute, seconds)
+
+    # TEME and ITRS differ only by the GMST rotation, so going through
+    # GCRS (and its costly nutation series) is unnecessary here.
+    r_itrs, _ = TEME_to_ITRF(t.whole, np.asarray(positions).T, np.asarray(velocities).T,
+                             fraction_ut1=t.ut1_fraction)
+
+    return itrs_to_geodetic(r_itrs)
+
+
+def itrs_to_geodetic(r_itrs):
+    x, y, z = r_itrs
+    R = np.sqrt(x * x + y * y)
+
+    lat = np.arctan2(z, R)
+    for _ in range(3):
+        sin_lat = np.sin(lat)
+        e2_sin_lat = _WGS84_E2 * sin_lat
+        aC = WGS84_RADIUS_KM / np.sqrt(1.0 - e2_sin_lat * sin_lat)
+        lat = np.arctan2(z + aC * e2_sin_lat, R)
+
+    lon = np.arctan2(y, x)
+    alt = R / np.cos(lat) - aC
+
+    return np.degrees(lat), np.degrees(lon), alt
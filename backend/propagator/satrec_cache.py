@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from threading import Lock
+from sgp4.api import Satrec
+from skyfield.api import load
+
+
+class SatrecCache:
+    _instance = None
+    maxsize = 512
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super(SatrecCache, cls).__new__(cls)
+            instance._satrecs = OrderedDict()
+            instance._timescale = None
+            instance._lock = Lock()
+            instance.hits = 0
+            instance.misses = 0
+            cls._instance = instance
+        return cls._instance
+
+    def get_satrec(self, tle_line1, tle_line2):
+        key = (tle_line1, tle_line2)
+
+        with self._lock:
+            satellite = self._satrecs.get(key)
+            if satellite is not None:
+                self._satrecs.move_to_end(key)
+                self.hits += 1
+                return satellite
+            self.misses += 1
+
+        satellite = Satrec.twoline2rv(tle_line1, tle_line2)
+
+        with self._lock:
+            self._satrecs[key] = satellite
+            self._satrecs.move_to_end(key)
+            while len(self._satrecs) > self.maxsize:
+                self._satrecs.popitem(last=False)
+
+        return satellite
+
+    def get_timescale(self):
+        if self._timescale is None:
+            with self._lock:
+                if self._timescale is None:
+                    self._timescale = load.timescale()
+        return self._timescale
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._satrecs),
+                'maxsize': self.maxsize
+            }
+
+    def clear(self):
+        with self._lock:
+            self._satrecs.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def get_satrec(tle_line1, tle_line2):
+    return SatrecCache().get_satrec(tle_line1, tle_line2)
+
+
+def get_timescale():
+    return SatrecCache().get_timescale()
@@ -1,46 +1,106 @@
-from sgp4.api import Satrec, jday
-from datetime import datetime, timedelta
+from sgp4.api import SatrecArray, jday
+from backend.propagator.satrec_cache import get_satrec
+from backend.propagator.trajectory import Trajectory
 import numpy as np
 import math
 
 
-def propagate_orbit(tle_line1, tle_line2, start_time, stop_time, step_seconds=60):
-    satellite = Satrec.twoline2rv(tle_line1, tle_line2)
-    
-    current_time = start_time
-    times = []
-    positions = []
-    velocities = []
+SECONDS_PER_DAY = 86400.0
+
+
+def build_offsets(start_time, stop_time, step_seconds=60):
+    span_seconds = (stop_time - start_time).total_seconds()
+    if span_seconds < 0:
+        return np.empty(0, dtype=np.float64)
+
+    count = int(math.floor(span_seconds / step_seconds)) + 1
+    return np.arange(count, dtype=np.float64) * step_seconds
+
+
+def offsets_to_julian(start_time, offsets):
+    jd0, fr0 = jday(start_time.year, start_time.month, start_time.day,
+                    start_time.hour, start_time.minute,
+                    start_time.second + start_time.microsecond * 1e-6)
+
+    fr = fr0 + np.asarray(offsets) / SECONDS_PER_DAY
+    whole_days = np.floor(fr)
+    jd = np.ascontiguousarray(jd0 + whole_days)
+    fr = np.ascontiguousarray(fr - whole_days)
+
+    return jd, fr
+
+
+def build_time_grid(start_time, stop_time, step_seconds=60):
+    offsets = build_offsets(start_time, stop_time, step_seconds)
+    jd, fr = offsets_to_julian(start_time, offsets)
+    return jd, fr, offsets
+
+
+def propagate_offsets(tle_line1, tle_line2, start_time, offsets):
+    satellite = get_satrec(tle_line1, tle_line2)
     
-    while current_time <= stop_time:
-        jd, fr = jday(current_time.year, current_time.month, current_time.day,
-                      current_time.hour, current_time.minute, current_time.second)
-        
-        error_code, position, velocity = satellite.sgp4(jd, fr)
-        
-        if error_code == 0:
-            times.append(current_time)
-            positions.append(position)
-            velocities.append(velocity)
-        
-        current_time += timedelta(seconds=step_seconds)
+    jd, fr = offsets_to_julian(start_time, offsets)
+    errors, positions, velocities = satellite.sgp4_array(jd, fr)
     
     return {
-        'times': times,
-        'positions': np.array(positions),
-        'velocities': np.array(velocities)
+        'start_time': start_time,
+        'offsets': offsets,
+        'jd': jd,
+        'fr': fr,
+        'positions': np.ascontiguousarray(positions),
+        'velocities': np.ascontiguousarray(velocities),
+        'errors': errors
+    }
+
+
+def propagate_orbit_batch(tle_line1, tle_line2, start_time, stop_time, step_seconds=60):
+    offsets = build_offsets(start_time, stop_time, step_seconds)
+    return propagate_offsets(tle_line1, tle_line2, start_time, offsets)
+
+
+def propagate_catalog(tle_pairs, start_time, stop_time, step_seconds=60):
+    satellites = SatrecArray([get_satrec(line1, line2) for line1, line2 in tle_pairs])
+
+    jd, fr, offsets = build_time_grid(start_time, stop_time, step_seconds)
+    errors, positions, velocities = satellites.sgp4(jd, fr)
+
+    return {
+        'start_time': start_time,
+        'offsets': offsets,
+        'jd': jd,
+        'fr': fr,
+        'positions': positions,
+        'velocities': velocities,
+        'errors': errors
     }
 
 
+def build_epochs(start_time, offsets):
+    start_ns = np.datetime64(start_time, 'ns').astype(np.int64)
+    return start_ns + np.round(np.asarray(offsets) * 1e9).astype(np.int64)
+
+
+def propagate_orbit(tle_line1, tle_line2, start_time, stop_time, step_seconds=60):
+    batch = propagate_orbit_batch(tle_line1, tle_line2, start_time, stop_time, step_seconds)
+
+    valid = batch['errors'] == 0
+    
+    return Trajectory(
+        build_epochs(start_time, batch['offsets'][valid]),
+        positions=batch['positions'][valid],
+        velocities=batch['velocities'][valid]
+    )
+
+
 def get_orbital_period_minutes(tle_line1, tle_line2):
-    satellite = Satrec.twoline2rv(tle_line1, tle_line2)
+    satellite = get_satrec(tle_line1, tle_line2)
     mean_motion = satellite.no_kozai
     period_minutes = (2 * math.pi) / mean_motion
     return period_minutes
 
 
 def compute_position_at_time(tle_line1, tle_line2, target_time):
-    satellite = Satrec.twoline2rv(tle_line1, tle_line2)
+    satellite = get_satrec(tle_line1, tle_line2)
     
     jd, fr = jday(target_time.year, target_time.month, target_time.day,
                   target_time.hour, target_time.minute, target_time.second)
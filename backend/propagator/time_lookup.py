@@ -0,0 +1,53 @@
+from backend.propagator.trace_geometry import datetime_to_ns
+from datetime import datetime, timedelta
+import numpy as np
+
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+
+def ns_to_datetime(epoch_ns):
+    return _UNIX_EPOCH + timedelta(microseconds=int(epoch_ns) // 1000)
+
+
+def find_closest_index(epochs, target_time):
+    if len(epochs) == 0:
+        return 0
+
+    target = datetime_to_ns(target_time)
+    index = int(np.searchsorted(epochs, target))
+    if index == 0:
+        return 0
+    if index == len(epochs):
+        return len(epochs) - 1
+
+    # Ties go to the earlier sample.
+    if target - epochs[index - 1] <= epochs[index] - target:
+        return index - 1
+    return index
+
+
+def interpolate_position(epochs, latitudes, longitudes, altitudes, target_time):
+    if len(epochs) == 0:
+        return None
+
+    target = min(max(datetime_to_ns(target_time), int(epochs[0])), int(epochs[-1]))
+    if len(epochs) == 1:
+        lo, fraction = 0, 0.0
+    else:
+        lo = min(int(np.searchsorted(epochs, target, side='right')) - 1, len(epochs) - 2)
+        fraction = (target - int(epochs[lo])) / (int(epochs[lo + 1]) - int(epochs[lo]))
+    hi = min(lo + 1, len(epochs) - 1)
+
+    # Interpolate longitude along the short way round, so a step across the
+    # antimeridian doesn't sweep back over the whole map.
+    step = (longitudes[hi] - longitudes[lo] + 180.0) % 360.0 - 180.0
+    longitude = (longitudes[lo] + fraction * step + 180.0) % 360.0 - 180.0
+
+    return {
+        'epoch': target,
+        'index': lo if fraction <= 0.5 else hi,
+        'latitude': float(latitudes[lo] + fraction * (latitudes[hi] - latitudes[lo])),
+        'longitude': float(longitude),
+        'altitude': float(altitudes[lo] + fraction * (altitudes[hi] - altitudes[lo]))
+    }
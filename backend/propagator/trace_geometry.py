@@ -0,0 +1,177 @@
+import numpy as np
+
+
+def datetime_to_ns(value):
+    return int(np.datetime64(value, 'ns').astype(np.int64))
+
+
+def assign_segments(epochs, segment1_end, segment2_end):
+    # Samples before segment1_end are 0, up to and including segment2_end
+    # are 1, and the rest are 2; epochs are sorted so two searches suffice.
+    epochs = np.asarray(epochs, dtype=np.int64)
+    first = int(np.searchsorted(epochs, datetime_to_ns(segment1_end), side='left'))
+    second = int(np.searchsorted(epochs, datetime_to_ns(segment2_end), side='right'))
+
+    segments = np.zeros(len(epochs), dtype=np.int8)
+    segments[first:second] = 1
+    segments[second:] = 2
+    return segments
+
+
+def _antimeridian_crossings(longitudes, latitudes):
+    steps = np.diff(longitudes)
+    crossings = np.flatnonzero(np.abs(steps) > 180)
+
+    lon1 = longitudes[crossings]
+    lon2 = longitudes[crossings + 1]
+    lat1 = latitudes[crossings]
+    lat2 = latitudes[crossings + 1]
+
+    # Eastward crossings jump from +180 to -180, so the step looks negative.
+    edges = np.where(steps[crossings] < 0, 180.0, -180.0)
+    fraction = (edges - lon1) / (lon2 + 2 * edges - lon1)
+    edge_latitudes = lat1 + fraction * (lat2 - lat1)
+
+    return crossings, edges, edge_latitudes
+
+
+def build_trace_segments(longitudes, latitudes, segment_ids=None):
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+
+    if len(longitudes) < 2:
+        return np.empty((0, 2, 2), dtype=np.float64), np.empty(0, dtype=np.int8)
+
+    points = np.column_stack((longitudes, latitudes))
+    lines = np.stack((points[:-1], points[1:]), axis=1)
+    if segment_ids is None:
+        ids = np.zeros(len(lines), dtype=np.int8)
+    else:
+        ids = np.asarray(segment_ids, dtype=np.int8)[:-1]
+
+    crossings, edges, edge_latitudes = _antimeridian_crossings(longitudes, latitudes)
+    if len(crossings) == 0:
+        return lines, ids
+
+    # Each crossing pair becomes two lines that meet the map edges.
+    before = lines[crossings].copy()
+    before[:, 1, 0] = edges
+    before[:, 1, 1] = edge_latitudes
+
+    after = lines[crossings].copy()
+    after[:, 0, 0] = -edges
+    after[:, 0, 1] = edge_latitudes
+
+    lines[crossings] = before
+    lines = np.insert(lines, crossings + 1, after, axis=0)
+    ids = np.insert(ids, crossings + 1, ids[crossings])
+    return lines, ids
+
+
+def build_trace_path(longitudes, latitudes):
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+
+    if len(longitudes) < 2:
+        return longitudes, latitudes
+
+    crossings, edges, edge_latitudes = _antimeridian_crossings(longitudes, latitudes)
+    if len(crossings) == 0:
+        return longitudes, latitudes
+
+    # Run to the map edge, break the line, and resume from the opposite edge.
+    positions = np.repeat(crossings + 1, 3)
+    inserted_lons = np.column_stack((edges, np.full(len(edges), np.nan), -edges)).ravel()
+    inserted_lats = np.column_stack((edge_latitudes, np.full(len(edges), np.nan), edge_latitudes)).ravel()
+
+    return (np.insert(longitudes, positions, inserted_lons),
+            np.insert(latitudes, positions, inserted_lats))
+
+
+def _simplify_runs(px, py, tolerance):
+    # Douglas-Peucker on every NaN-separated run at once: each pass finds,
+    # for every open range, the sample farthest from its chord and splits
+    # there if it strays by more than the tolerance.
+    finite = np.isfinite(px) & np.isfinite(py)
+    edges = np.diff(np.concatenate(([False], finite, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+
+    keep = ~finite
+    keep[starts] = True
+    keep[ends] = True
+    active = np.flatnonzero(finite & ~keep)
+
+    while len(active):
+        kept = np.flatnonzero(keep)
+        slot = np.searchsorted(kept, active) - 1
+        a = kept[slot]
+        b = kept[slot + 1]
+
+        dx = px[b] - px[a]
+        dy = py[b] - py[a]
+        length_sq = dx * dx + dy * dy
+        with np.errstate(invalid='ignore', divide='ignore'):
+            t = np.clip(((px[active] - px[a]) * dx + (py[active] - py[a]) * dy) / length_sq, 0.0, 1.0)
+        t[length_sq == 0] = 0.0
+        distance = np.hypot(px[active] - (px[a] + t * dx), py[active] - (py[a] + t * dy))
+
+        # Active samples are sorted, so each range's samples are contiguous.
+        first = np.flatnonzero(np.concatenate(([True], slot[1:] != slot[:-1])))
+        worst = np.maximum.reduceat(distance, first)
+        group = np.repeat(np.arange(len(first)), np.diff(np.append(first, len(active))))
+
+        split = worst > tolerance
+        farthest = (distance == worst[group]) & split[group]
+        _, pick = np.unique(group[farthest], return_index=True)
+        keep[active[np.flatnonzero(farthest)[pick]]] = True
+
+        active = active[split[group] & ~keep[active]]
+
+    return keep
+
+
+def decimate_path(x, y, xlim, ylim, width_px, height_px, tolerance_px=1.0):
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) < 3 or width_px <= 0 or height_px <= 0:
+        return x, y
+
+    x0, x1 = sorted(xlim)
+    y0, y1 = sorted(ylim)
+
+    # Clip to the view: keep both ends of every segment whose bounding box
+    # meets it, so lines still run off the edges (or straight across when
+    # samples are sparse), and break the line wherever points were cut.
+    with np.errstate(invalid='ignore'):
+        crosses = ((np.minimum(x[:-1], x[1:]) <= x1) & (np.maximum(x[:-1], x[1:]) >= x0) &
+                   (np.minimum(y[:-1], y[1:]) <= y1) & (np.maximum(y[:-1], y[1:]) >= y0))
+    visible = np.zeros(len(x), dtype=bool)
+    visible[:-1] |= crosses
+    visible[1:] |= crosses
+
+    kept = np.flatnonzero(visible)
+    gaps = np.flatnonzero(np.diff(kept) > 1) + 1
+    x = np.insert(x[kept], gaps, np.nan)
+    y = np.insert(y[kept], gaps, np.nan)
+    if len(x) < 3:
+        return x, y
+
+    # Simplify in screen pixels, so the vertex count follows how much of the
+    # path the view shows rather than how densely it was sampled. Runs of
+    # samples inside one small cell are thinned first, which is cheap and
+    # takes most of the load off Douglas-Peucker on dense traces; each step
+    # gets half the tolerance.
+    px = (x - x0) * (width_px / (x1 - x0))
+    py = (y - y0) * (height_px / (y1 - y0))
+
+    cell = tolerance_px / 2.0 / np.sqrt(2.0)
+    with np.errstate(invalid='ignore'):
+        cell_x = np.floor(px / cell)
+        cell_y = np.floor(py / cell)
+    thin = np.ones(len(x), dtype=bool)
+    thin[1:-1] = (cell_x[1:-1] != cell_x[:-2]) | (cell_y[1:-1] != cell_y[:-2])
+    x, y, px, py = x[thin], y[thin], px[thin], py[thin]
+
+    keep = _simplify_runs(px, py, tolerance_px / 2.0)
+    return x[keep], y[keep]
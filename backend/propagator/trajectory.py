@@ -0,0 +1,50 @@
+from backend.propagator.time_lookup import find_closest_index, interpolate_position, ns_to_datetime
+import numpy as np
+
+
+class Trajectory:
+    __slots__ = ('epochs', 'columns', '_times')
+
+    def __init__(self, epochs, **columns):
+        self.epochs = np.asarray(epochs, dtype=np.int64)
+        self.columns = {name: np.asarray(values) for name, values in columns.items()}
+        self._times = None
+
+    def __len__(self):
+        return len(self.epochs)
+
+    def __getattr__(self, name):
+        try:
+            return object.__getattribute__(self, 'columns')[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            # Slices share memory with this trajectory.
+            return Trajectory(self.epochs[key], **{name: values[key] for name, values in self.columns.items()})
+        if key == 'epochs':
+            return self.epochs
+        if key == 'times':
+            return self.times
+        return self.columns[key]
+
+    @property
+    def times(self):
+        # Python datetimes are only built when something asks for all of them.
+        if self._times is None:
+            self._times = self.epochs.view('datetime64[ns]').astype('datetime64[us]').tolist()
+        return self._times
+
+    def time_at(self, index):
+        return ns_to_datetime(self.epochs[index])
+
+    @property
+    def nbytes(self):
+        return self.epochs.nbytes + sum(values.nbytes for values in self.columns.values())
+
+    def find_index(self, target_time):
+        return find_closest_index(self.epochs, target_time)
+
+    def interpolate(self, target_time):
+        return interpolate_position(self.epochs, self.latitudes, self.longitudes, self.altitudes, target_time)
@@ -0,0 +1,143 @@
+from collections import OrderedDict
+from threading import Lock
+from backend.propagator.sgp4_propagator import build_offsets, propagate_offsets, build_epochs
+from backend.propagator.coordinate_converter import teme_to_geodetic
+from backend.propagator.trace_geometry import datetime_to_ns
+from backend.propagator.trajectory import Trajectory
+import numpy as np
+
+
+CHUNK_SAMPLES = 20000
+
+
+class ComputationCancelled(Exception):
+    pass
+
+
+class TrajectoryCache:
+    _instance = None
+    max_bytes = 256 * 1024 * 1024
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super(TrajectoryCache, cls).__new__(cls)
+            instance._entries = OrderedDict()
+            instance._lock = Lock()
+            instance.total_bytes = 0
+            instance.hits = 0
+            instance.misses = 0
+            cls._instance = instance
+        return cls._instance
+
+    def get(self, tle_line1, tle_line2, start_time, stop_time, step_seconds):
+        with self._lock:
+            for entry_key, entry in reversed(self._entries.items()):
+                line1, line2, step, entry_start, entry_stop = entry_key
+                if (line1, line2, step) != (tle_line1, tle_line2, step_seconds):
+                    continue
+                if start_time < entry_start or stop_time > entry_stop:
+                    continue
+
+                # Adaptive samples have no grid to align with; any sub-window
+                # of them is still within tolerance.
+                start_ns = datetime_to_ns(start_time)
+                fixed_step = isinstance(step_seconds, (int, float))
+                if fixed_step and (start_ns - datetime_to_ns(entry_start)) % int(round(step_seconds * 1e9)) != 0:
+                    continue
+
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return self._slice(entry, start_ns, datetime_to_ns(stop_time))
+
+            self.misses += 1
+            return None
+
+    def put(self, tle_line1, tle_line2, start_time, stop_time, step_seconds, trajectory):
+        entry_key = (tle_line1, tle_line2, step_seconds, start_time, stop_time)
+        size = self._entry_bytes(trajectory)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(entry_key, None)
+            if previous is not None:
+                self.total_bytes -= self._entry_bytes(previous)
+
+            self._entries[entry_key] = trajectory
+            self.total_bytes += size
+
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= self._entry_bytes(evicted)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _slice(self, entry, start_ns, stop_ns):
+        lo = int(np.searchsorted(entry.epochs, start_ns, side='left'))
+        hi = int(np.searchsorted(entry.epochs, stop_ns, side='right'))
+
+        if lo == 0 and hi == len(entry):
+            return entry
+        return entry[lo:hi]
+
+    def _entry_bytes(self, trajectory):
+        return trajectory.nbytes
+
+
+def get_geodetic_trajectory(tle_line1, tle_line2, start_time, stop_time, step_seconds=60,
+                            progress_callback=None, is_cancelled=None):
+    cache = TrajectoryCache()
+
+    trajectory = cache.get(tle_line1, tle_line2, start_time, stop_time, step_seconds)
+    if trajectory is not None:
+        return trajectory
+
+    grid = build_offsets(start_time, stop_time, step_seconds)
+    chunks = {'offsets': [], 'latitudes': [], 'longitudes': [], 'altitudes': []}
+
+    for lo in range(0, len(grid), CHUNK_SAMPLES):
+        if is_cancelled is not None and is_cancelled():
+            raise ComputationCancelled()
+
+        result = propagate_offsets(tle_line1, tle_line2, start_time, grid[lo:lo + CHUNK_SAMPLES])
+        valid = result['errors'] == 0
+        offsets = result['offsets'][valid]
+
+        latitudes, longitudes, altitudes = teme_to_geodetic(
+            start_time,
+            offsets,
+            result['positions'][valid],
+            result['velocities'][valid]
+        )
+
+        chunks['offsets'].append(offsets)
+        chunks['latitudes'].append(latitudes)
+        chunks['longitudes'].append(longitudes)
+        chunks['altitudes'].append(altitudes)
+
+        if progress_callback is not None:
+            progress_callback(int(100 * min(lo + CHUNK_SAMPLES, len(grid)) / len(grid)))
+
+    columns = {
+        name: np.concatenate(parts) if parts else np.empty(0, dtype=np.float64)
+        for name, parts in chunks.items()
+    }
+    trajectory = Trajectory(build_epochs(start_time, columns.pop('offsets')), **columns)
+
+    cache.put(tle_line1, tle_line2, start_time, stop_time, step_seconds, trajectory)
+    return trajectory
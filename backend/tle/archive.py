@@ -0,0 +1,160 @@
+from PySide6.QtCore import QStandardPaths
+from backend.tle.parser import COLUMNS, parse_tle_columns, chunk_to_dataframe
+import pandas as pd
+import numpy as np
+import sqlite3
+import os
+
+
+ARCHIVE_FILENAME = 'tle_archive.sqlite'
+
+_ELEMENT_COLUMNS = [name for name, _ in COLUMNS if name != 'time']
+
+
+def default_archive_path():
+    directory = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+    if not directory:
+        directory = os.path.join(os.path.expanduser('~'), '.orbitt')
+    return os.path.join(directory, ARCHIVE_FILENAME)
+
+
+class TLEArchive:
+
+    def __init__(self, path=None):
+        self.path = path or default_archive_path()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self._create_schema()
+
+        # Writes come from a worker thread on a connection of their own, so
+        # with WAL the GUI thread keeps reading while they commit. Only one
+        # thread may write at a time.
+        self._writer = sqlite3.connect(self.path, check_same_thread=False)
+
+    def _create_schema(self):
+        element_columns = ', '.join(
+            f'{name} {"INTEGER" if name == "revolution_number" else "REAL"}'
+            for name in _ELEMENT_COLUMNS
+        )
+
+        # Elements are clustered on (norad_id, epoch), so each object's history
+        # is stored contiguously and epoch lookups are index range scans.
+        # History is kept per NORAD ID: the same object loaded from several
+        # sources shares one row and is restored as a single satellite.
+        self.connection.executescript(f'''
+            CREATE TABLE IF NOT EXISTS objects (
+                norad_id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                hidden INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS elements (
+                norad_id TEXT NOT NULL,
+                epoch INTEGER NOT NULL,
+                {element_columns},
+                line1 TEXT NOT NULL,
+                line2 TEXT NOT NULL,
+                PRIMARY KEY (norad_id, epoch, line1, line2)
+            ) WITHOUT ROWID;
+        ''')
+
+        columns = [row[1] for row in self.connection.execute('PRAGMA table_info(objects)')]
+        if 'hidden' not in columns:
+            self.connection.execute('ALTER TABLE objects ADD COLUMN hidden INTEGER NOT NULL DEFAULT 0')
+        self.connection.commit()
+
+    def list_objects(self):
+        cursor = self.connection.execute('SELECT norad_id, name FROM objects WHERE hidden = 0 ORDER BY rowid')
+        return cursor.fetchall()
+
+    def append(self, norad_id, dataframe, tle_lines, name=None):
+        self.append_many([(norad_id, dataframe, tle_lines, name)])
+
+    def append_many(self, objects):
+        objects = [obj for obj in objects if obj[2]]
+        if not objects:
+            return
+
+        # Each object's parsed frame is reused when it has one row per
+        # record. If duplicates were dropped from it, its rows no longer line
+        # up with the records, so just that object is parsed again.
+        frames = []
+        for _, dataframe, tle_lines, _ in objects:
+            if dataframe is None or len(dataframe) != len(tle_lines):
+                dataframe = chunk_to_dataframe(parse_tle_columns(
+                    np.array([line1 for line1, _ in tle_lines], dtype='S69'),
+                    np.array([line2 for _, line2 in tle_lines], dtype='S69')
+                ))
+            frames.append(dataframe)
+        df = pd.concat(frames, ignore_index=True)
+
+        tle_lines = [pair for _, _, lines, _ in objects for pair in lines]
+        rows = zip(
+            [norad_id for norad_id, _, lines, _ in objects for _ in lines],
+            df['time'].to_numpy().astype('datetime64[us]').astype(np.int64).tolist(),
+            *[df[name].tolist() for name in _ELEMENT_COLUMNS],
+            [line1 for line1, _ in tle_lines],
+            [line2 for _, line2 in tle_lines]
+        )
+
+        placeholders = ', '.join('?' * (len(_ELEMENT_COLUMNS) + 4))
+        # Loading a removed object again brings it back with its old history.
+        self._writer.executemany(
+            'INSERT INTO objects (norad_id, name) VALUES (?, ?) '
+            'ON CONFLICT (norad_id) DO UPDATE SET hidden = 0',
+            [(norad_id, name or norad_id) for norad_id, _, _, name in objects]
+        )
+        self._writer.executemany(
+            f'INSERT OR IGNORE INTO elements (norad_id, epoch, {", ".join(_ELEMENT_COLUMNS)}, line1, line2) '
+            f'VALUES ({placeholders})',
+            rows
+        )
+
+    def load_object(self, norad_id):
+        df = pd.read_sql_query(
+            f'SELECT epoch, {", ".join(_ELEMENT_COLUMNS)}, line1, line2 FROM elements '
+            'WHERE norad_id = ? ORDER BY epoch',
+            self.connection,
+            params=(norad_id,)
+        )
+
+        tle_lines = list(zip(df.pop('line1'), df.pop('line2')))
+        df.insert(0, 'time', df.pop('epoch').to_numpy().astype('datetime64[us]'))
+        df = df.astype(dict(COLUMNS)).drop_duplicates().reset_index(drop=True)
+
+        return {
+            'norad_id': norad_id,
+            'dataframe': df,
+            'tle_lines': tle_lines
+        }
+
+    def latest_epochs(self):
+        cursor = self.connection.execute('SELECT norad_id, MAX(epoch) FROM elements GROUP BY norad_id')
+        return {
+            norad_id: pd.Timestamp(np.datetime64(epoch, 'us')).to_pydatetime()
+            for norad_id, epoch in cursor
+        }
+
+    def lookup(self, norad_id, epoch):
+        epoch_us = int(np.datetime64(epoch, 'us').astype(np.int64))
+        row = self.connection.execute(
+            'SELECT line1, line2 FROM elements WHERE norad_id = ? AND epoch <= ? '
+            'ORDER BY epoch DESC LIMIT 1',
+            (norad_id, epoch_us)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def rename(self, norad_id, name):
+        self._writer.execute('UPDATE objects SET name = ? WHERE norad_id = ?', (name, norad_id))
+
+    def hide(self, norad_id):
+        # The element history stays archived; the object is just not restored.
+        self._writer.execute('UPDATE objects SET hidden = 1 WHERE norad_id = ?', (norad_id,))
+
+    def commit(self):
+        self._writer.commit()
+
+    def close(self):
+        self._writer.close()
+        self.connection.close()
@@ -0,0 +1,257 @@
+from PySide6.QtCore import QObject, QThread, QCoreApplication, Signal
+from backend.utils.auth_config import AuthConfig
+from backend.tle.download_scheduler import (MAX_RETRIES, BACKOFF_SECONDS, REQUEST_TIMEOUT,
+                                            RETRY_STATUS_CODES, get_rate_limiter)
+from backend.tle.spacetrack_fetcher import build_history_queries, build_sync_queries, QueryAssembler
+from backend.tle.parser import TLEGroupBuilder
+from backend.utils.spacetrack import SpaceTrackSessionManager
+import asyncio
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+MAX_CONCURRENCY = 8
+
+
+def is_available():
+    return httpx is not None
+
+
+class EventLoopThread(QThread):
+
+    def __init__(self):
+        super().__init__()
+        self.loop = asyncio.new_event_loop()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.quit()
+        self.wait()
+
+
+class AsyncFetchService:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super(AsyncFetchService, cls).__new__(cls)
+            instance._thread = None
+            instance._client = None
+            instance._semaphore = None
+            instance._login_lock = None
+            instance._generation = None
+            cls._instance = instance
+        return cls._instance
+
+    def submit(self, coroutine):
+        if self._thread is None:
+            self._thread = EventLoopThread()
+            self._thread.start()
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.shutdown)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._thread.loop)
+
+    def shutdown(self):
+        if self._thread is None:
+            return
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._thread.loop).result()
+            self._client = None
+        self._thread.stop()
+        self._thread = None
+
+    def _ensure_client(self):
+        # Created lazily so the client and its locks belong to the loop thread.
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=REQUEST_TIMEOUT,
+                headers={'Accept-Encoding': 'gzip'},
+                limits=httpx.Limits(max_connections=MAX_CONCURRENCY,
+                                    max_keepalive_connections=MAX_CONCURRENCY)
+            )
+            self._semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+            self._login_lock = asyncio.Lock()
+        return self._client
+
+    def _adopt_cookies(self):
+        # The shared requests session does the logging in; this client only
+        # borrows its cookies, so both backends hold a single login.
+        session, self._generation = SpaceTrackSessionManager().current()
+        self._client.cookies = httpx.Cookies(session.cookies)
+
+    async def authenticate(self, email, password):
+        self._ensure_client()
+        async with self._login_lock:
+            if not await asyncio.to_thread(SpaceTrackSessionManager().authenticate, email, password):
+                return False
+            self._adopt_cookies()
+            return True
+
+    async def _relogin(self, generation):
+        async with self._login_lock:
+            # Another request may have refreshed the cookies while we waited.
+            if generation != self._generation:
+                return True
+            if not await asyncio.to_thread(SpaceTrackSessionManager().relogin, generation):
+                return False
+            self._adopt_cookies()
+            return True
+
+    async def stream_lines(self, url, consumer):
+        client = self._ensure_client()
+        rate_limiter = get_rate_limiter()
+
+        async with self._semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                while (wait := rate_limiter.reserve()) > 0.0:
+                    await asyncio.sleep(wait)
+
+                generation = self._generation
+                retry_after = None
+                try:
+                    async with client.stream('GET', url) as response:
+                        if response.status_code == 200:
+                            return await consumer(response.aiter_lines())
+                        status_code = response.status_code
+                        retry_after = response.headers.get('Retry-After')
+                except (httpx.TimeoutException, httpx.TransportError) as e:
+                    status_code = None
+                    error = e
+
+                if status_code == 401 and await self._relogin(generation):
+                    continue
+                if status_code is not None:
+                    error = Exception(f"Space-Track returned HTTP {status_code}")
+                    if status_code not in RETRY_STATUS_CODES:
+                        raise error
+
+                if attempt == MAX_RETRIES:
+                    raise Exception(f"Failed to fetch TLE data: {str(error)}")
+
+                delay = BACKOFF_SECONDS * (2 ** attempt)
+                if retry_after is not None and retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+                await asyncio.sleep(delay)
+
+
+class AsyncSpaceTrackFetcher(QObject):
+
+    progress_update = Signal(str)
+    object_ready = Signal(object)
+    fetch_complete = Signal(bool, str)
+
+    empty_message = "No TLE data found for the specified parameters"
+    backend_notice = None
+
+    def __init__(self, norad_ids, start_date, end_date):
+        super().__init__()
+        self.norad_ids = norad_ids
+        self.start_date = start_date
+        self.end_date = end_date
+        self.auth_config = AuthConfig()
+        self.base_url = self.auth_config.get_base_url()
+        self.service = AsyncFetchService()
+        self.since_epochs = None
+        self.assembler = None
+        self._future = None
+        self._completed = 0
+
+    def start(self):
+        self._future = self.service.submit(self._run())
+
+    def isRunning(self):
+        return self._future is not None and not self._future.done()
+
+    def stop(self):
+        if self._future is not None:
+            self._future.cancel()
+
+    def _build_queries(self):
+        return build_history_queries(self.base_url, self.norad_ids, self.start_date, self.end_date)
+
+    async def _run(self):
+        try:
+            self.progress_update.emit("Authenticating with Space-Track...")
+            email, password = self.auth_config.get_credentials()
+            if not email or not password or not await self._authenticate(email, password):
+                self.fetch_complete.emit(False, "Authentication failed")
+                return
+
+            self.progress_update.emit(f"Fetching TLE data for {len(self.norad_ids)} object(s)...")
+            object_count = await self._fetch_tle_data()
+
+            if object_count:
+                self.progress_update.emit("TLE data fetched successfully")
+                self.fetch_complete.emit(True, "Success")
+            else:
+                self.fetch_complete.emit(False, self.empty_message)
+
+        except asyncio.CancelledError:
+            self.fetch_complete.emit(False, "Fetch cancelled")
+            raise
+        except Exception as e:
+            self.fetch_complete.emit(False, f"Error: {str(e)}")
+
+    async def _authenticate(self, email, password):
+        try:
+            return await self.service.authenticate(email, password)
+        except Exception:
+            return False
+
+    async def _fetch_tle_data(self):
+        self.assembler = QueryAssembler(self._build_queries(), self.since_epochs, self.object_ready.emit)
+        self._completed = 0
+
+        tasks = [asyncio.ensure_future(self._fetch_query(index, url))
+                 for index, url in enumerate(self.assembler.urls)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return self.assembler.object_count
+
+    async def _fetch_query(self, index, url):
+        async def consume(lines):
+            builder = TLEGroupBuilder()
+            groups = []
+
+            async for line in lines:
+                group = builder.feed(line)
+                if group is not None:
+                    groups.append(group)
+
+            group = builder.finish()
+            if group is not None:
+                groups.append(group)
+            return groups
+
+        # Nothing is emitted until the whole body has arrived, so a retry
+        # after a dropped stream cannot repeat objects.
+        groups = await self.service.stream_lines(url, consume)
+        self.assembler.add_response(index, groups)
+
+        self._completed += 1
+        self.progress_update.emit(f"Fetched {self._completed} of {len(self.assembler.urls)} queries...")
+
+
+class AsyncSpaceTrackSyncFetcher(AsyncSpaceTrackFetcher):
+
+    empty_message = "All objects are already up to date"
+
+    def __init__(self, since_epochs):
+        super().__init__(list(since_epochs), None, None)
+        self.since_epochs = since_epochs
+
+    def _build_queries(self):
+        return build_sync_queries(self.base_url, self.since_epochs)
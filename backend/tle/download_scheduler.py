@@ -0,0 +1,180 @@
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from datetime import timedelta
+from threading import Lock, Event
+import requests
+import time
+
+
+# Space-Track's published API limits.
+REQUESTS_PER_MINUTE = 30
+REQUESTS_PER_HOUR = 300
+
+IDS_PER_QUERY = 100
+DAYS_PER_QUERY = 30
+MAX_WORKERS = 4
+MAX_RETRIES = 4
+BACKOFF_SECONDS = 2.0
+REQUEST_TIMEOUT = 60
+STREAM_CHUNK_BYTES = 64 * 1024
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError)
+
+
+class DownloadCancelled(Exception):
+    pass
+
+
+class RateLimiter:
+
+    def __init__(self, limits=((REQUESTS_PER_MINUTE, 60.0), (REQUESTS_PER_HOUR, 3600.0))):
+        self.limits = limits
+        self._history = deque()
+        self._lock = Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            longest = max(period for _, period in self.limits)
+            while self._history and now - self._history[0] >= longest:
+                self._history.popleft()
+
+            wait = 0.0
+            for count, period in self.limits:
+                recent = [t for t in self._history if now - t < period]
+                if len(recent) >= count:
+                    wait = max(wait, recent[-count] + period - now)
+
+            if wait <= 0.0:
+                self._history.append(now)
+            return wait
+
+    def acquire(self, cancel_event=None):
+        while True:
+            wait = self.reserve()
+            if wait <= 0.0:
+                return
+
+            if cancel_event is not None:
+                if cancel_event.wait(wait):
+                    raise DownloadCancelled()
+            else:
+                time.sleep(wait)
+
+
+# The limits apply per account, so every scheduler and the asyncio backend
+# draw from one limiter.
+_RATE_LIMITER = RateLimiter()
+
+
+def get_rate_limiter():
+    return _RATE_LIMITER
+
+
+def split_ids(norad_ids, chunk_size=IDS_PER_QUERY):
+    norad_ids = list(norad_ids)
+    return [norad_ids[i:i + chunk_size] for i in range(0, len(norad_ids), chunk_size)]
+
+
+def split_date_range(start_date, end_date, days=DAYS_PER_QUERY):
+    # Consecutive ranges share their boundary date, matching how a single
+    # start--end query covers the whole span.
+    ranges = []
+    chunk_start = start_date
+    while True:
+        chunk_end = min(chunk_start + timedelta(days=days), end_date)
+        ranges.append((chunk_start, chunk_end))
+        if chunk_end >= end_date:
+            return ranges
+        chunk_start = chunk_end
+
+
+class DownloadScheduler:
+
+    def __init__(self, session, max_workers=MAX_WORKERS, rate_limiter=None,
+                 max_retries=MAX_RETRIES, backoff_seconds=BACKOFF_SECONDS):
+        self.session = session
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or _RATE_LIMITER
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._cancel_event = Event()
+        self._completed = 0
+        self._lock = Lock()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def run(self, urls, progress_callback=None, consumer=None, result_callback=None):
+        self._completed = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._download, index, url, len(urls), progress_callback, consumer,
+                                result_callback)
+                for index, url in enumerate(urls)
+            ]
+            try:
+                # Results come back in query order so each object's records
+                # stay in chronological order across date chunks.
+                return [future.result() for future in futures]
+            except BaseException:
+                self.cancel()
+                raise
+
+    def _download(self, index, url, total, progress_callback, consumer, result_callback):
+        if consumer is not None:
+            read = lambda response: consumer(index, response)
+        else:
+            read = lambda response: response.text
+        result = self._fetch_with_retries(url, read)
+
+        # Only a response that arrived in full is handed on, so a retried
+        # query never delivers part of its data twice.
+        if result_callback is not None:
+            result_callback(index, result)
+
+        with self._lock:
+            self._completed += 1
+            completed = self._completed
+
+        if progress_callback is not None:
+            progress_callback(completed, total)
+        return result
+
+    def _fetch_with_retries(self, url, read):
+        for attempt in range(self.max_retries + 1):
+            if self.is_cancelled():
+                raise DownloadCancelled()
+
+            self.rate_limiter.acquire(self._cancel_event)
+
+            retry_after = None
+            try:
+                response = self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True,
+                                            headers={'Accept-Encoding': 'gzip'})
+                with response:
+                    # The body is read inside the retry loop, so a connection
+                    # dropped mid-response is retried like any other failure.
+                    if response.status_code == 200:
+                        return read(response)
+                    if response.status_code not in RETRY_STATUS_CODES:
+                        raise Exception(f"Space-Track returned HTTP {response.status_code}")
+                    error = Exception(f"Space-Track returned HTTP {response.status_code}")
+                    retry_after = response.headers.get('Retry-After')
+            except RETRY_EXCEPTIONS as e:
+                error = e
+
+            if attempt == self.max_retries:
+                raise Exception(f"Failed to fetch TLE data: {str(error)}")
+
+            delay = self.backoff_seconds * (2 ** attempt)
+            if retry_after is not None and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            if self._cancel_event.wait(delay):
+                raise DownloadCancelled()
@@ -1,64 +1,371 @@
 import pandas as pd
 import numpy as np
-from sgp4.api import Satrec, days2mdhms
-from datetime import datetime
+import math
+import io
 
 
-def parse_tle_file(filepath):
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
+DEFAULT_CHUNK_SIZE = 10000
 
-    tle_data = []
-    tle_lines = []
-    norad_id = None
+# WGS72 constants, matching Satrec.twoline2rv's defaults.
+RADIUS_EARTH_KM = 6378.135
+J2 = 0.001082616
+XKE = 60.0 / math.sqrt(RADIUS_EARTH_KM ** 3 / 398600.8)
+XPDOTP = 1440.0 / (2.0 * math.pi)
 
-    for i in range(0, len(lines), 2):
-        if i + 1 >= len(lines):
-            break
+COLUMNS = [
+    ('time', 'datetime64[us]'),
+    ('a', np.float64),
+    ('apogee', np.float64),
+    ('perigee', np.float64),
+    ('e', np.float64),
+    ('i', np.float64),
+    ('raan', np.float64),
+    ('aop', np.float64),
+    ('ma', np.float64),
+    ('bstar', np.float64),
+    ('mean_motion', np.float64),
+    ('mean_motion_derivative', np.float64),
+    ('revolution_number', np.int64)
+]
 
-        line1 = lines[i][:69]
-        line2 = lines[i + 1][:69]
 
-        if norad_id is None:
-            norad_id_raw = line1[2:7].strip()
-            norad_id = str(int(norad_id_raw))
+def iter_tle_pairs(lines):
+    pending = None
+
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if not line.strip():
+            continue
+
+        if pending is None:
+            pending = line
+        else:
+            yield pending[:69], line[:69]
+            pending = None
+
+
+def _allocate_buffers(size):
+    return np.empty(size, dtype='S69'), np.empty(size, dtype='S69')
+
+
+def _as_matrix(lines):
+    matrix = lines.view(np.uint8).reshape(len(lines), 69).copy()
+    matrix[matrix == 0] = ord(' ')
+    return matrix
+
+
+def _int_field(matrix, start, stop):
+    field = matrix[:, start:stop]
+    digits = field.astype(np.int64) - ord('0')
+
+    # Blanks pad numbers and read as zero; anything else is malformed, like
+    # int() would reject it, rather than a silently different number.
+    blank = field == ord(' ')
+    invalid = ((digits < 0) | (digits > 9)) & ~blank
+    if invalid.any():
+        row = int(np.flatnonzero(invalid.any(axis=1))[0])
+        value = field[row].tobytes().decode('ascii', 'replace')
+        raise ValueError(f"Invalid TLE field at columns {start + 1}-{stop}: {value!r}")
+    digits[blank] = 0
+    weights = 10 ** np.arange(stop - start - 1, -1, -1, dtype=np.int64)
+    return digits @ weights
+
+
+def _float_field(matrix, start, stop):
+    width = stop - start
+    field = np.ascontiguousarray(matrix[:, start:stop]).view(f'S{width}').ravel()
+    blank = (matrix[:, start:stop] == ord(' ')).all(axis=1)
+    return np.where(blank, b'0', field).astype(np.float64)
+
+
+def _epochs(matrix):
+    two_digit_year = _int_field(matrix, 18, 20)
+    year = np.where(two_digit_year < 57, 2000 + two_digit_year, 1900 + two_digit_year)
+    day_of_year = _float_field(matrix, 20, 32)
+
+    year_start = (year - 1970).astype('datetime64[Y]').astype('datetime64[us]')
+    elapsed = np.rint((day_of_year - 1.0) * 86400e6).astype(np.int64)
+    return year_start + elapsed.astype('timedelta64[us]')
+
+
+def _semi_major_axis(mean_motion, eccentricity, inclination):
+    # Undo the Kozai mean motion the same way sgp4's initl() does, so the
+    # result matches Satrec.a for the WGS72 constants used by twoline2rv.
+    no_kozai = mean_motion / XPDOTP
+    cosio2 = np.cos(np.radians(inclination)) ** 2
+    omeosq = 1.0 - eccentricity * eccentricity
+
+    ak = np.power(XKE / no_kozai, 2.0 / 3.0)
+    d1 = 0.75 * J2 * (3.0 * cosio2 - 1.0) / (np.sqrt(omeosq) * omeosq)
+    delta = d1 / (ak * ak)
+    adel = ak * (1.0 - delta * delta - delta * (1.0 / 3.0 + 134.0 * delta * delta / 81.0))
+    delta = d1 / (adel * adel)
+    no_unkozai = no_kozai / (1.0 + delta)
+
+    return np.power(XKE / no_unkozai, 2.0 / 3.0) * RADIUS_EARTH_KM
+
 
+def parse_tle_columns(line1s, line2s):
+    line1 = _as_matrix(line1s)
+    line2 = _as_matrix(line2s)
+
+    bstar_sign = np.where(line1[:, 53] == ord('-'), -1.0, 1.0)
+    bstar_exponent_sign = np.where(line1[:, 59] == ord('-'), -1, 1)
+    bstar = (bstar_sign * _int_field(line1, 54, 59) * 1e-5
+             * np.power(10.0, bstar_exponent_sign * _int_field(line1, 60, 61)))
+
+    eccentricity = _int_field(line2, 26, 33) * 1e-7
+    inclination = _float_field(line2, 8, 16)
+    mean_motion = _float_field(line2, 52, 63)
+
+    semi_major_axis = _semi_major_axis(mean_motion, eccentricity, inclination)
+
+    return {
+        'norad_id': _int_field(line1, 2, 7),
+        'time': _epochs(line1),
+        'a': semi_major_axis,
+        'apogee': semi_major_axis * (1 + eccentricity) - RADIUS_EARTH_KM,
+        'perigee': semi_major_axis * (1 - eccentricity) - RADIUS_EARTH_KM,
+        'e': eccentricity,
+        'i': inclination,
+        'raan': _float_field(line2, 17, 25),
+        'aop': _float_field(line2, 34, 42),
+        'ma': _float_field(line2, 43, 51),
+        'bstar': bstar,
+        'mean_motion': mean_motion,
+        'mean_motion_derivative': _float_field(line1, 33, 43),
+        'revolution_number': _int_field(line2, 63, 68)
+    }
+
+
+def _finish_chunk(line1s, line2s, tle_lines, size):
+    chunk = parse_tle_columns(line1s[:size], line2s[:size])
+    chunk['tle_lines'] = tle_lines
+    return chunk
+
+
+def iter_tle_chunks(lines, chunk_size=DEFAULT_CHUNK_SIZE):
+    line1s, line2s = _allocate_buffers(chunk_size)
+    tle_lines = []
+
+    for line1, line2 in iter_tle_pairs(lines):
+        row = len(tle_lines)
+        line1s[row] = line1
+        line2s[row] = line2
         tle_lines.append((line1, line2))
 
-        rso = Satrec.twoline2rv(line1, line2)
-
-        month, day, hour, minute, second = days2mdhms(rso.epochyr, rso.epochdays)
-        micsec = (second - int(second)) * 1e6
-        epoch = datetime(int(2000 + rso.epochyr), int(month), int(day),
-                         int(hour), int(minute), int(second), int(micsec))
-
-        semi_major_axis = rso.a * rso.radiusearthkm
-        eccentricity = rso.ecco
-        
-        apogee = semi_major_axis * (1 + eccentricity) - rso.radiusearthkm
-        perigee = semi_major_axis * (1 - eccentricity) - rso.radiusearthkm
-
-        tle_data.append({
-            'time': epoch,
-            'a': semi_major_axis,
-            'apogee': apogee,
-            'perigee': perigee,
-            'e': eccentricity,
-            'i': np.degrees(rso.inclo),
-            'raan': np.degrees(rso.nodeo),
-            'aop': np.degrees(rso.argpo),
-            'ma': np.degrees(rso.mo),
-            'bstar': rso.bstar,
-            'mean_motion': rso.no_kozai * 60 * 24 / (2 * np.pi),
-            'mean_motion_derivative': rso.ndot * 60 * 60 * 24 * 24 / (2 * np.pi),
-            'revolution_number': rso.revnum
-        })
-
-    df = pd.DataFrame(tle_data)
+        if len(tle_lines) == chunk_size:
+            yield _finish_chunk(line1s, line2s, tle_lines, chunk_size)
+            tle_lines = []
+
+    if tle_lines:
+        yield _finish_chunk(line1s, line2s, tle_lines, len(tle_lines))
+
+
+def chunk_to_dataframe(chunk, rows=None):
+    if rows is None:
+        return pd.DataFrame({name: chunk[name] for name, _ in COLUMNS})
+    return pd.DataFrame({name: chunk[name][rows] for name, _ in COLUMNS})
+
+
+def iter_norad_dataframes(lines, chunk_size=DEFAULT_CHUNK_SIZE):
+    for chunk in iter_tle_chunks(lines, chunk_size):
+        order = np.argsort(chunk['norad_id'], kind='stable')
+        sorted_ids = chunk['norad_id'][order]
+        boundaries = np.flatnonzero(np.diff(sorted_ids)) + 1
+
+        for rows in np.split(order, boundaries):
+            norad_id = chunk['norad_id'][rows[0]]
+            df = chunk_to_dataframe(chunk, rows)
+            df = df.drop_duplicates().reset_index(drop=True)
+            tle_lines = [chunk['tle_lines'][row] for row in rows]
+            yield str(norad_id), df, tle_lines
+
+
+def parse_tle_lines(lines, chunk_size=DEFAULT_CHUNK_SIZE):
+    frames = []
+    tle_lines = []
+    norad_id = None
+
+    for chunk in iter_tle_chunks(lines, chunk_size):
+        if norad_id is None:
+            norad_id = str(chunk['norad_id'][0])
+        frames.append(chunk_to_dataframe(chunk))
+        tle_lines.extend(chunk['tle_lines'])
+
+    if frames:
+        df = pd.concat(frames, ignore_index=True)
+    else:
+        df = pd.DataFrame(columns=[name for name, _ in COLUMNS])
     df = df.drop_duplicates().reset_index(drop=True)
 
     return {
         'norad_id': norad_id,
         'dataframe': df,
         'tle_lines': tle_lines
-    }
\ No newline at end of file
+    }
+
+
+def parse_tle_file(filepath, chunk_size=DEFAULT_CHUNK_SIZE):
+    with open(filepath, 'r') as f:
+        return parse_tle_lines(f, chunk_size)
+
+
+def group_chunks_by_norad(chunks):
+    # Each chunk is sorted by object once; objects collect row ranges of the
+    # sorted chunks and their lines, in the order they first appeared.
+    pieces = {}
+    lines = {}
+
+    for chunk in chunks:
+        order = np.argsort(chunk['norad_id'], kind='stable')
+        norad_ids = chunk['norad_id'][order]
+        columns = {name: chunk[name][order] for name, _ in COLUMNS}
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(norad_ids)) + 1))
+        stops = np.append(starts[1:], len(order))
+
+        for start, stop in sorted(zip(starts, stops), key=lambda bounds: order[bounds[0]]):
+            norad_id = str(norad_ids[start])
+            pieces.setdefault(norad_id, []).append((columns, start, stop))
+            lines.setdefault(norad_id, []).extend(chunk['tle_lines'][row] for row in order[start:stop])
+
+    if not pieces:
+        return []
+
+    # One concat puts every object's rows back to back; duplicates are then
+    # dropped within each object in a single pass.
+    ranges = [piece for parts in pieces.values() for piece in parts]
+    df = pd.DataFrame({
+        name: np.concatenate([columns[name][start:stop] for columns, start, stop in ranges])
+        for name, _ in COLUMNS
+    })
+    sizes = [sum(stop - start for _, start, stop in parts) for parts in pieces.values()]
+    owner = np.repeat(np.arange(len(pieces)), sizes)
+
+    keep = ~df.assign(norad_id=owner).duplicated().to_numpy()
+    df = df[keep]
+    bounds = np.searchsorted(owner[keep], np.arange(len(pieces) + 1))
+
+    return [
+        {
+            'norad_id': norad_id,
+            'dataframe': df.iloc[bounds[index]:bounds[index + 1]].reset_index(drop=True),
+            'tle_lines': lines[norad_id]
+        }
+        for index, norad_id in enumerate(pieces)
+    ]
+
+
+def parse_tle_catalog(filepath, chunk_size=DEFAULT_CHUNK_SIZE):
+    with open(filepath, 'r') as f:
+        return parse_tle_catalog_lines(f, chunk_size)
+
+
+def iter_text_lines(data):
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return io.TextIOWrapper(io.BytesIO(data), encoding='ascii', errors='replace')
+    if isinstance(data, str):
+        return io.StringIO(data)
+    return data
+
+
+def parse_tle_catalog_lines(lines, chunk_size=DEFAULT_CHUNK_SIZE):
+    return group_chunks_by_norad(iter_tle_chunks(lines, chunk_size))
+
+
+def parse_tle_text(data, chunk_size=DEFAULT_CHUNK_SIZE):
+    return parse_tle_catalog_lines(iter_text_lines(data), chunk_size)
+
+
+def _select_rows(chunk, rows):
+    selected = {name: values[rows] for name, values in chunk.items() if name != 'tle_lines'}
+    selected['tle_lines'] = [chunk['tle_lines'][row] for row in np.flatnonzero(rows)]
+    return selected
+
+
+def iter_newer_chunks(chunks, since_epochs):
+    for chunk in chunks:
+        norad_ids, inverse = np.unique(chunk['norad_id'], return_inverse=True)
+        since = np.array([
+            np.datetime64(since_epochs[str(norad_id)], 'us') if str(norad_id) in since_epochs
+            else np.datetime64('NaT', 'us')
+            for norad_id in norad_ids
+        ])
+
+        # Records for objects we don't track compare against NaT and drop out.
+        newer = chunk['time'] > since[inverse]
+        if newer.any():
+            yield _select_rows(chunk, newer)
+
+
+def parse_tle_updates(data, since_epochs, chunk_size=DEFAULT_CHUNK_SIZE):
+    chunks = iter_tle_chunks(iter_text_lines(data), chunk_size)
+    return group_chunks_by_norad(iter_newer_chunks(chunks, since_epochs))
+
+
+class TLEGroupBuilder:
+    # Groups records ordered by NORAD ID, as Space-Track returns them for
+    # orderby/NORAD_CAT_ID queries; each object is returned once it ends.
+
+    def __init__(self):
+        self._pending = None
+        self._group = []
+
+    def feed(self, line):
+        line = line.rstrip('\r\n')
+        if not line.strip():
+            return None
+
+        if self._pending is None:
+            self._pending = line
+            return None
+
+        line1, line2 = self._pending[:69], line[:69]
+        self._pending = None
+
+        completed = None
+        if self._group and line1[2:7] != self._group[-1][0][2:7]:
+            completed = self._group
+            self._group = []
+        self._group.append((line1, line2))
+        return completed
+
+    def finish(self):
+        completed = self._group or None
+        self._group = []
+        return completed
+
+
+def iter_tle_groups(lines):
+    builder = TLEGroupBuilder()
+
+    for line in lines:
+        group = builder.feed(line)
+        if group is not None:
+            yield group
+
+    group = builder.finish()
+    if group is not None:
+        yield group
+
+
+def parse_tle_group(tle_lines, since_epochs=None):
+    chunk = parse_tle_columns(
+        np.array([line1 for line1, _ in tle_lines], dtype='S69'),
+        np.array([line2 for _, line2 in tle_lines], dtype='S69')
+    )
+    chunk['tle_lines'] = tle_lines
+    norad_id = str(chunk['norad_id'][0])
+
+    if since_epochs is not None:
+        if norad_id not in since_epochs:
+            return None
+        chunk = _select_rows(chunk, chunk['time'] > np.datetime64(since_epochs[norad_id], 'us'))
+        if not chunk['tle_lines']:
+            return None
+
+    return {
+        'norad_id': norad_id,
+        'dataframe': chunk_to_dataframe(chunk).drop_duplicates().reset_index(drop=True),
+        'tle_lines': chunk['tle_lines']
+    }
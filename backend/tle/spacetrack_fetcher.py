@@ -1,12 +1,144 @@
-import requests
 from PySide6.QtCore import QThread, Signal
 from backend.utils.auth_config import AuthConfig
+from backend.utils.spacetrack import SpaceTrackSessionManager
+from backend.tle.download_scheduler import (DownloadScheduler, DownloadCancelled, STREAM_CHUNK_BYTES,
+                                            split_ids, split_date_range)
+from backend.tle.parser import iter_tle_groups, parse_tle_group
+from datetime import timedelta
+from threading import Lock
+
+
+# Objects whose latest epochs are this close share a sync query.
+SYNC_EPOCH_BAND = timedelta(days=1)
+
+ASYNC_FALLBACK_NOTICE = "httpx is not installed, so the threaded downloader was used instead of asyncio."
+
+
+def build_history_queries(base_url, norad_ids, start_date, end_date):
+    queries = []
+    for chunk in split_ids(norad_ids):
+        norad_ids_str = ','.join(map(str, chunk))
+        windows = []
+        for window_start, window_end in split_date_range(start_date, end_date):
+            start_str = window_start.strftime('%Y-%m-%d')
+            end_str = window_end.strftime('%Y-%m-%d')
+            windows.append(f"{base_url}/basicspacedata/query/class/gp_history/"
+                           f"NORAD_CAT_ID/{norad_ids_str}/"
+                           f"CREATION_DATE/{start_str}--{end_str}/"
+                           f"orderby/NORAD_CAT_ID,EPOCH/format/tle/")
+        queries.append(windows)
+    return queries
+
+
+def build_sync_queries(base_url, since_epochs):
+    # Objects are grouped into bands of similar epochs and each query asks
+    # from the oldest epoch in its band, so one stale object only pulls its
+    # own backlog; records an object already has are dropped again before
+    # it is emitted.
+    norad_ids = sorted(since_epochs, key=since_epochs.get)
+
+    bands = []
+    for norad_id in norad_ids:
+        if not bands or since_epochs[norad_id] - since_epochs[bands[-1][0]] > SYNC_EPOCH_BAND:
+            bands.append([])
+        bands[-1].append(norad_id)
+
+    queries = []
+    for band in bands:
+        for chunk in split_ids(band):
+            since_str = since_epochs[chunk[0]].strftime('%Y-%m-%dT%H:%M:%S.%f')
+            queries.append([f"{base_url}/basicspacedata/query/class/gp_history/"
+                            f"NORAD_CAT_ID/{','.join(map(str, chunk))}/"
+                            f"EPOCH/%3E{since_str}/"
+                            f"orderby/NORAD_CAT_ID,EPOCH/format/tle/"])
+    return queries
+
+
+class QueryAssembler:
+
+    def __init__(self, queries, since_epochs, emit):
+        self.since_epochs = since_epochs
+        self.emit = emit
+        self.urls = []
+        self.object_count = 0
+        self._slots = []
+        self._pending = {}
+        self._lock = Lock()
+
+        for chunk_index, windows in enumerate(queries):
+            for window_index, url in enumerate(windows):
+                self.urls.append(url)
+                self._slots.append((chunk_index, window_index, len(windows)))
+
+    def is_single_window(self, index):
+        # With a single date window every object in the response is complete.
+        return self._slots[index][2] == 1
+
+    def add_response(self, index, groups):
+        # Called once per query with the whole response, after it arrived
+        # without error; partial responses from failed attempts never get here.
+        if self.is_single_window(index):
+            for tle_lines in groups:
+                self.add_object(tle_lines)
+        else:
+            self.add_window(index, groups)
+
+    def add_window(self, index, groups):
+        chunk_index, window_index, window_count = self._slots[index]
+        with self._lock:
+            windows = self._pending.setdefault(chunk_index, [None] * window_count)
+            windows[window_index] = groups
+            if any(window is None for window in windows):
+                return
+            del self._pending[chunk_index]
+
+        merged = {}
+        for groups in windows:
+            for tle_lines in groups:
+                merged.setdefault(tle_lines[0][0][2:7], []).extend(tle_lines)
+        for tle_lines in merged.values():
+            self.add_object(tle_lines)
+
+    def add_object(self, tle_lines):
+        result = parse_tle_group(tle_lines, self.since_epochs)
+        if result is None:
+            return
+
+        with self._lock:
+            self.object_count += 1
+        self.emit(result)
+
+
+def create_tle_fetcher(norad_ids, start_date, end_date):
+    if AuthConfig().get_fetch_backend() == 'asyncio':
+        from backend.tle import async_fetcher
+        if async_fetcher.is_available():
+            return async_fetcher.AsyncSpaceTrackFetcher(norad_ids, start_date, end_date)
+        fetcher = SpaceTrackTLEFetcher(norad_ids, start_date, end_date)
+        fetcher.backend_notice = ASYNC_FALLBACK_NOTICE
+        return fetcher
+    return SpaceTrackTLEFetcher(norad_ids, start_date, end_date)
+
+
+def create_sync_fetcher(since_epochs):
+    if AuthConfig().get_fetch_backend() == 'asyncio':
+        from backend.tle import async_fetcher
+        if async_fetcher.is_available():
+            return async_fetcher.AsyncSpaceTrackSyncFetcher(since_epochs)
+        fetcher = SpaceTrackSyncFetcher(since_epochs)
+        fetcher.backend_notice = ASYNC_FALLBACK_NOTICE
+        return fetcher
+    return SpaceTrackSyncFetcher(since_epochs)
 
 
 class SpaceTrackTLEFetcher(QThread):
     
     progress_update = Signal(str)
-    fetch_complete = Signal(bool, str, str)
+    object_ready = Signal(object)
+    fetch_complete = Signal(bool, str)
+
+    empty_message = "No TLE data found for the specified parameters"
+    backend_notice = None
 
     def __init__(self, norad_ids, start_date, end_date):
         super().__init__()
@@ -14,69 +146,75 @@ class SpaceTrackTLEFetcher(QThread):
         self.start_date = start_date
         self.end_date = end_date
         self.auth_config = AuthConfig()
-        self.session = None
+        self.base_url = self.auth_config.get_base_url()
+        self.session_manager = SpaceTrackSessionManager()
+        self.scheduler = None
+        self.since_epochs = None
+        self.assembler = None
 
     def run(self):
         try:
             self.progress_update.emit("Authenticating with Space-Track...")
             if not self._authenticate():
-                self.fetch_complete.emit(False, "Authentication failed", "")
+                self.fetch_complete.emit(False, "Authentication failed")
                 return
 
             self.progress_update.emit(f"Fetching TLE data for {len(self.norad_ids)} object(s)...")
-            tle_data = self._fetch_tle_data()
+            object_count = self._fetch_tle_data()
             
-            if tle_data:
+            if object_count:
                 self.progress_update.emit("TLE data fetched successfully")
-                self.fetch_complete.emit(True, "Success", tle_data)
+                self.fetch_complete.emit(True, "Success")
             else:
-                self.fetch_complete.emit(False, "No TLE data found for the specified parameters", "")
+                self.fetch_complete.emit(False, self.empty_message)
 
+        except DownloadCancelled:
+            self.fetch_complete.emit(False, "Fetch cancelled")
         except Exception as e:
-            self.fetch_complete.emit(False, f"Error: {str(e)}", "")
-        finally:
-            if self.session:
-                self.session.close()
+            self.fetch_complete.emit(False, f"Error: {str(e)}")
 
     def _authenticate(self):
         email, password = self.auth_config.get_credentials()
         if not email or not password:
             return False
 
-        self.session = requests.Session()
-        login_url = "https://www.space-track.org/ajaxauth/login"
-        login_data = {
-            'identity': email,
-            'password': password
-        }
-
         try:
-            response = self.session.post(login_url, data=login_data, timeout=10)
-            return response.status_code == 200
+            return self.session_manager.authenticate(email, password)
         except:
             return False
 
+    def _build_queries(self):
+        return build_history_queries(self.base_url, self.norad_ids, self.start_date, self.end_date)
+
     def _fetch_tle_data(self):
-        start_str = self.start_date.strftime('%Y-%m-%d')
-        end_str = self.end_date.strftime('%Y-%m-%d')
+        self.assembler = QueryAssembler(self._build_queries(), self.since_epochs, self.object_ready.emit)
+        self.scheduler = DownloadScheduler(self.session_manager)
+        self.scheduler.run(self.assembler.urls, self._on_query_complete, self._consume_response,
+                           self.assembler.add_response)
+        return self.assembler.object_count
 
-        norad_ids_str = ','.join(map(str, self.norad_ids))
-        
-        url = (f"https://www.space-track.org/basicspacedata/query/class/gp_history/"
-               f"NORAD_CAT_ID/{norad_ids_str}/"
-               f"CREATION_DATE/{start_str}--{end_str}/"
-               f"orderby/EPOCH/format/tle/")
+    def _consume_response(self, index, response):
+        lines = (line.decode('ascii', 'replace')
+                 for line in response.iter_lines(chunk_size=STREAM_CHUNK_BYTES))
+        return list(iter_tle_groups(lines))
 
-        try:
-            response = self.session.get(url, timeout=30)
-            if response.status_code == 200 and response.text.strip():
-                return response.text
-            return None
-        except Exception as e:
-            raise Exception(f"Failed to fetch TLE data: {str(e)}")
+    def _on_query_complete(self, completed, total):
+        self.progress_update.emit(f"Fetched {completed} of {total} queries...")
 
     def stop(self):
-        if self.session:
-            self.session.close()
+        if self.scheduler:
+            self.scheduler.cancel()
         self.quit()
         self.wait()
+
+
+class SpaceTrackSyncFetcher(SpaceTrackTLEFetcher):
+
+    empty_message = "All objects are already up to date"
+
+    def __init__(self, since_epochs):
+        super().__init__(list(since_epochs), None, None)
+        self.since_epochs = since_epochs
+
+    def _build_queries(self):
+        return build_sync_queries(self.base_url, self.since_epochs)
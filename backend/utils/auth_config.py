@@ -1,6 +1,9 @@
 from PySide6.QtCore import QSettings
 
 
+SPACETRACK_BASE_URL = "https://www.space-track.org"
+
+
 class AuthConfig:
     
     def __init__(self):
@@ -22,3 +25,14 @@ class AuthConfig:
     def clear_credentials(self):
         self.settings.remove("email")
         self.settings.remove("password")
+    
+    def get_base_url(self):
+        return self.settings.value("base_url", SPACETRACK_BASE_URL).rstrip('/')
+    
+    def get_fetch_backend(self):
+        # "thread" or "asyncio"; asyncio needs httpx and falls back to
+        # threads without it.
+        return self.settings.value("fetch_backend", "thread")
+
+    def set_fetch_backend(self, backend):
+        self.settings.setValue("fetch_backend", backend)
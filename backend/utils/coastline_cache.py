@@ -0,0 +1,125 @@
+from PySide6.QtCore import QStandardPaths
+from matplotlib.path import Path
+import numpy as np
+import json
+import os
+
+
+SHAPEFILE_PATH = os.path.join('assets', 'ne_10m_land', 'ne_10m_land.shp')
+TOLERANCES = (0.01, 0.05, 0.2)
+DEFAULT_TOLERANCE = 0.01
+CACHE_FORMAT = 1
+
+_ARRAYS = ('vertices', 'ring_offsets', 'polygon_offsets')
+
+
+def default_cache_dir():
+    directory = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    if not directory:
+        directory = os.path.join(os.path.expanduser('~'), '.orbitt', 'cache')
+    return os.path.join(directory, 'coastlines')
+
+
+def _array_path(cache_dir, tolerance, name):
+    return os.path.join(cache_dir, f"land_{tolerance:g}_{name}.npy")
+
+
+def _source_key(shapefile_path):
+    stat = os.stat(shapefile_path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def _read_meta(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, 'meta.json'), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _pack_polygons(geometries):
+    import shapely
+
+    parts = shapely.get_parts(geometries)
+    parts = parts[~shapely.is_empty(parts)]
+    # Exteriors counter-clockwise and holes clockwise, so a single compound
+    # path fills correctly with the non-zero winding rule.
+    if hasattr(shapely, 'orient_polygons'):
+        parts = shapely.orient_polygons(parts)
+    else:
+        # shapely < 2.1 only orients one polygon at a time.
+        from shapely.geometry.polygon import orient
+        parts = np.array([orient(part, sign=1.0) for part in parts], dtype=object)
+
+    rings, polygon_index = shapely.get_rings(parts, return_index=True)
+    vertices, ring_index = shapely.get_coordinates(rings, return_index=True)
+
+    ring_sizes = np.bincount(ring_index, minlength=len(rings))
+    polygon_sizes = np.bincount(polygon_index, minlength=len(parts))
+
+    return {
+        'vertices': vertices.astype(np.float32),
+        'ring_offsets': np.concatenate(([0], np.cumsum(ring_sizes))).astype(np.int64),
+        'polygon_offsets': np.concatenate(([0], np.cumsum(polygon_sizes))).astype(np.int64)
+    }
+
+
+def build_coastline_cache(shapefile_path=SHAPEFILE_PATH, cache_dir=None, tolerances=TOLERANCES):
+    # geopandas is only needed for this one-time preprocessing step.
+    import geopandas as gpd
+
+    cache_dir = cache_dir or default_cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+
+    geometries = gpd.read_file(shapefile_path).geometry
+    for tolerance in tolerances:
+        packed = _pack_polygons(geometries.simplify(tolerance=tolerance).to_numpy())
+        for name in _ARRAYS:
+            path = _array_path(cache_dir, tolerance, name)
+            np.save(path + '.tmp.npy', packed[name])
+            os.replace(path + '.tmp.npy', path)
+
+    # The metadata goes last, so an interrupted build is never mistaken for
+    # a valid cache.
+    meta = {'format': CACHE_FORMAT, 'source': _source_key(shapefile_path), 'tolerances': list(tolerances)}
+    with open(os.path.join(cache_dir, 'meta.json.tmp'), 'w') as f:
+        json.dump(meta, f)
+    os.replace(os.path.join(cache_dir, 'meta.json.tmp'), os.path.join(cache_dir, 'meta.json'))
+
+
+def _is_cache_valid(meta, shapefile_path, tolerance):
+    if meta is None or meta.get('format') != CACHE_FORMAT or tolerance not in meta.get('tolerances', []):
+        return False
+    # Without the shapefile, whatever cache exists is the best we have.
+    if not os.path.exists(shapefile_path):
+        return True
+    return meta.get('source') == _source_key(shapefile_path)
+
+
+def load_coastlines(tolerance=DEFAULT_TOLERANCE, shapefile_path=SHAPEFILE_PATH, cache_dir=None):
+    cache_dir = cache_dir or default_cache_dir()
+
+    if not _is_cache_valid(_read_meta(cache_dir), shapefile_path, tolerance):
+        if not os.path.exists(shapefile_path):
+            return None
+        build_coastline_cache(shapefile_path, cache_dir)
+
+    return {
+        name: np.load(_array_path(cache_dir, tolerance, name), mmap_mode='r')
+        for name in _ARRAYS
+    }
+
+
+def coastline_path(coastlines):
+    vertices = coastlines['vertices']
+    ring_offsets = coastlines['ring_offsets']
+
+    codes = np.full(len(vertices), Path.LINETO, dtype=Path.code_type)
+    codes[ring_offsets[:-1]] = Path.MOVETO
+    codes[ring_offsets[1:] - 1] = Path.CLOSEPOLY
+
+    return Path(vertices, codes)
+
+
+if __name__ == '__main__':
+    build_coastline_cache()
@@ -1,5 +1,10 @@
-import geopandas as gpd
-import os
+from PySide6.QtCore import QObject, Signal
+from backend.utils.coastline_cache import load_coastlines, coastline_path, DEFAULT_TOLERANCE
+from threading import Thread, Lock
+
+
+class MapLoaderSignals(QObject):
+    map_loaded = Signal(object)
 
 
 class MapLoader:
@@ -9,15 +14,39 @@ class MapLoader:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(MapLoader, cls).__new__(cls)
+            cls._instance.signals = MapLoaderSignals()
+            cls._instance._loading = False
+            cls._instance._lock = Lock()
         return cls._instance
 
     def load_world_map(self):
-        if self._world_map is None:
-            shapefile_path = os.path.join('assets', 'ne_10m_land', 'ne_10m_land.shp')
-            if os.path.exists(shapefile_path):
-                self._world_map = gpd.read_file(shapefile_path)
-                self._world_map = self._world_map.simplify(tolerance=0.01)
+        with self._lock:
+            if self._world_map is None:
+                coastlines = load_coastlines(DEFAULT_TOLERANCE)
+                if coastlines is not None:
+                    MapLoader._world_map = coastline_path(coastlines)
         return self._world_map
 
+    def load_world_map_async(self):
+        with self._lock:
+            if self._world_map is not None or self._loading:
+                return
+            self._loading = True
+
+        Thread(target=self._load_in_background, daemon=True).start()
+
+    def _load_in_background(self):
+        try:
+            world_map = self.load_world_map()
+        except Exception:
+            world_map = None
+        finally:
+            with self._lock:
+                self._loading = False
+        self.signals.map_loaded.emit(world_map)
+
+    def is_loading(self):
+        return self._loading
+
     def get_world_map(self):
-        return self._world_map
\ No newline at end of file
+        return self._world_map
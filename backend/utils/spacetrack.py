@@ -1,5 +1,125 @@
 import requests
+import time
+from threading import Lock
+from requests.adapters import HTTPAdapter
 from PySide6.QtCore import QThread, Signal
+from backend.utils.auth_config import AuthConfig
+
+
+# Space-Track expires session cookies after about two hours of use.
+SESSION_LIFETIME = 90 * 60
+POOL_SIZE = 8
+
+
+class SpaceTrackSessionManager:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super(SpaceTrackSessionManager, cls).__new__(cls)
+            instance.session = instance._create_session()
+            instance._credentials = None
+            instance._login_time = None
+            instance._generation = 0
+            instance._lock = Lock()
+            cls._instance = instance
+        return cls._instance
+
+    def _create_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _is_expired(self):
+        return self._login_time is None or time.monotonic() - self._login_time > SESSION_LIFETIME
+
+    def open_session(self, email, password):
+        session = self._create_session()
+        login_url = f"{AuthConfig().get_base_url()}/ajaxauth/login"
+        login_data = {
+            'identity': email,
+            'password': password
+        }
+
+        try:
+            response = session.post(login_url, data=login_data, timeout=10)
+        except Exception:
+            session.close()
+            raise
+        if response.status_code != 200:
+            session.close()
+            return None
+        return session
+
+    def _install(self, session, email, password):
+        # Requests still running on the old session keep its cookies, so it
+        # is dropped rather than cleared or closed.
+        self.session = session
+        self._credentials = (email, password)
+        self._login_time = time.monotonic()
+        self._generation += 1
+
+    def _login(self, email, password):
+        session = self.open_session(email, password)
+        if session is None:
+            return False
+        self._install(session, email, password)
+        return True
+
+    def login(self, email, password):
+        with self._lock:
+            return self._login(email, password)
+
+    def adopt(self, session, email, password):
+        with self._lock:
+            self._install(session, email, password)
+
+    def authenticate(self, email=None, password=None):
+        if email is None or password is None:
+            email, password = AuthConfig().get_credentials()
+        if not email or not password:
+            return False
+
+        with self._lock:
+            if self._credentials == (email, password) and not self._is_expired():
+                return True
+            return self._login(email, password)
+
+    def relogin(self, generation):
+        with self._lock:
+            # Another request may have logged in again while we waited.
+            if generation != self._generation:
+                return True
+            if self._credentials is None:
+                return False
+            return self._login(*self._credentials)
+
+    def current(self):
+        with self._lock:
+            return self.session, self._generation
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            credentials = self._credentials or (None, None)
+        if not self.authenticate(*credentials):
+            raise Exception("Authentication failed")
+
+        session, generation = self.current()
+        response = session.get(url, **kwargs)
+        if response.status_code == 401 and self.relogin(generation):
+            response.close()
+            session, _ = self.current()
+            response = session.get(url, **kwargs)
+        return response
+
+    def logout(self):
+        with self._lock:
+            self.session = self._create_session()
+            self._credentials = None
+            self._login_time = None
+            self._generation += 1
 
 
 class SpaceTrackAuth(QThread):
@@ -10,35 +130,38 @@ class SpaceTrackAuth(QThread):
         super().__init__()
         self.email = email
         self.password = password
-        self.session = requests.Session()
+        self.session_manager = SpaceTrackSessionManager()
 
     def run(self):
         try:
-            login_url = "https://www.space-track.org/ajaxauth/login"
-            login_data = {
-                'identity': self.email,
-                'password': self.password
-            }
-
-            response = self.session.post(login_url, data=login_data, timeout=10)
-
-            if response.status_code == 200:
-                test_url = "https://www.space-track.org/basicspacedata/query/class/tle_latest/ORDINAL/1/limit/1/format/json"
-                test_response = self.session.get(test_url, timeout=10)
-
-                if test_response.status_code == 200:
-                    try:
-                        data = test_response.json()
-                        if isinstance(data, list) and len(data) > 0:
-                            self.login_result.emit(True, "Login successful")
-                        else:
-                            self.login_result.emit(False, "Authentication failed")
-                    except:
-                        self.login_result.emit(False, "Invalid response format")
+            # The shared session is only replaced once the new credentials
+            # have been checked, so a failed attempt leaves it logged in.
+            session = self.session_manager.open_session(self.email, self.password)
+            if session is None:
+                self.login_result.emit(False, "Login request failed")
+                return
+
+            test_url = f"{AuthConfig().get_base_url()}/basicspacedata/query/class/tle_latest/ORDINAL/1/limit/1/format/json"
+            test_response = session.get(test_url, timeout=10)
+
+            if test_response.status_code == 200:
+                try:
+                    data = test_response.json()
+                    valid = isinstance(data, list) and len(data) > 0
+                except:
+                    session.close()
+                    self.login_result.emit(False, "Invalid response format")
+                    return
+
+                if valid:
+                    self.session_manager.adopt(session, self.email, self.password)
+                    self.login_result.emit(True, "Login successful")
                 else:
+                    session.close()
                     self.login_result.emit(False, "Authentication failed")
             else:
-                self.login_result.emit(False, "Login request failed")
+                session.close()
+                self.login_result.emit(False, "Authentication failed")
 
         except requests.exceptions.Timeout:
             self.login_result.emit(False, "Connection timeout")
@@ -48,7 +171,6 @@ class SpaceTrackAuth(QThread):
             self.login_result.emit(False, f"Unexpected error: {str(e)}")
 
     def stop(self):
-        self.session.close()
         self.quit()
         self.wait()
 
@@ -62,22 +184,12 @@ def validate_spacetrack_credentials(email, password):
 
 
 def create_spacetrack_session(email, password):
-    session = requests.Session()
+    session_manager = SpaceTrackSessionManager()
     try:
-        login_url = "https://www.space-track.org/ajaxauth/login"
-        login_data = {
-            'identity': email,
-            'password': password
-        }
-
-        response = session.post(login_url, data=login_data, timeout=10)
-
-        if response.status_code == 200:
-            return session, True, "Session created successfully"
+        if session_manager.authenticate(email, password):
+            return session_manager.session, True, "Session created successfully"
         else:
-            session.close()
             return None, False, "Failed to create session"
 
     except Exception as e:
-        session.close()
         return None, False, f"Error creating session: {str(e)}"
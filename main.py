@@ -1,18 +1,34 @@
+import time
+_startup_begin = time.perf_counter()
+
 import sys
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
+from PySide6.QtCore import QTimer
 from app.app_controller import AppController
-from backend.utils.map_loader import MapLoader
+
+
+def _report_startup(timings):
+    total = time.perf_counter() - _startup_begin
+    stages = ', '.join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in timings)
+    print(f"Startup: {stages}, first event loop pass {total * 1000:.0f} ms")
+
 
 if __name__ == "__main__":
+    timings = [("imports", time.perf_counter() - _startup_begin)]
+
+    stage_begin = time.perf_counter()
     app = QApplication(sys.argv)
     app.setApplicationName("ORBITT")
     app.setOrganizationName("ORBITT")
     app.setWindowIcon(QIcon("assets/icon.png"))
+    timings.append(("application", time.perf_counter() - stage_begin))
 
-    map_loader = MapLoader()
-    map_loader.load_world_map()
-
+    # The world map is loaded in the background when the first map tab opens.
+    stage_begin = time.perf_counter()
     controller = AppController()
     controller.show()
+    timings.append(("main window", time.perf_counter() - stage_begin))
+
+    QTimer.singleShot(0, lambda: _report_startup(timings))
     sys.exit(app.exec())
\ No newline at end of file
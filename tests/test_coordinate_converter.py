@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta
+from skyfield.api import EarthSatellite, load, wgs84
+from backend.propagator.coordinate_converter import teme_to_geodetic
+from backend.propagator.sgp4_propagator import build_offsets, propagate_offsets
+import numpy as np
+
+
+LINE1 = '1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927'
+LINE2 = '2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537'
+
+
+def test_matches_skyfield_subpoint():
+    start_time = datetime(2008, 9, 20, 12, 25, 40)
+    offsets = build_offsets(start_time, start_time + timedelta(hours=6))
+    propagated = propagate_offsets(LINE1, LINE2, start_time, offsets)
+
+    latitudes, longitudes, altitudes = teme_to_geodetic(
+        start_time, offsets, propagated['positions'], propagated['velocities'])
+
+    # The per-sample Skyfield conversion this replaced.
+    ts = load.timescale()
+    satellite = EarthSatellite(LINE1, LINE2, ts=ts)
+    times = [start_time + timedelta(seconds=offset) for offset in offsets]
+    t = ts.utc([time.year for time in times], [time.month for time in times], [time.day for time in times],
+               [time.hour for time in times], [time.minute for time in times], [time.second for time in times])
+    subpoint = wgs84.subpoint(satellite.at(t))
+
+    assert np.abs(latitudes - subpoint.latitude.degrees).max() < 1e-11
+    assert np.abs(longitudes - subpoint.longitude.degrees).max() < 1e-11
+    assert np.abs(altitudes - subpoint.elevation.km).max() < 1e-10
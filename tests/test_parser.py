@@ -0,0 +1,64 @@
+from backend.tle.parser import parse_tle_text
+import pytest
+
+
+LINE1 = '1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927'
+LINE2 = '2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537'
+
+
+def test_parses_well_formed_lines():
+    results = parse_tle_text(f'{LINE1}\n{LINE2}\n')
+
+    assert [result['norad_id'] for result in results] == ['25544']
+    assert results[0]['dataframe']['e'].iloc[0] == pytest.approx(0.0006703)
+    assert results[0]['dataframe']['revolution_number'].iloc[0] == 56353
+
+
+def test_blank_padded_catalog_number_is_accepted():
+    line1 = LINE1[:2] + '  694' + LINE1[7:]
+    line2 = LINE2[:2] + '  694' + LINE2[7:]
+
+    results = parse_tle_text(f'{line1}\n{line2}\n')
+
+    assert [result['norad_id'] for result in results] == ['694']
+
+
+def test_alpha5_catalog_number_is_rejected():
+    line1 = LINE1[:2] + 'A0001' + LINE1[7:]
+    line2 = LINE2[:2] + 'A0001' + LINE2[7:]
+
+    with pytest.raises(ValueError):
+        parse_tle_text(f'{line1}\n{line2}\n')
+
+
+def test_corrupted_integer_field_is_rejected():
+    # Eccentricity with a letter O in place of a zero.
+    line2 = LINE2[:26] + 'O006703' + LINE2[33:]
+
+    with pytest.raises(ValueError):
+        parse_tle_text(f'{LINE1}\n{line2}\n')
+
+
+def test_grouping_does_not_depend_on_chunk_size():
+    # Objects reappear after others and one record is repeated, as in
+    # concatenated catalog snapshots.
+    records = []
+    for revolution in range(5):
+        for norad_id in ('25544', '00694', '43013'):
+            line1 = LINE1[:2] + norad_id + LINE1[7:20] + f'{264 + revolution:03d}' + LINE1[23:]
+            line2 = LINE2[:2] + norad_id + LINE2[7:63] + f'{56353 + revolution:5d}' + LINE2[68:]
+            records.append((line1, line2))
+    records.append(records[0])
+    text = ''.join(f'{line1}\n{line2}\n' for line1, line2 in records)
+
+    whole = parse_tle_text(text)
+    assert [result['norad_id'] for result in whole] == ['25544', '694', '43013']
+    assert [len(result['tle_lines']) for result in whole] == [6, 5, 5]
+    assert [len(result['dataframe']) for result in whole] == [5, 5, 5]
+
+    for chunk_size in (1, 2, 4):
+        chunked = parse_tle_text(text, chunk_size)
+        for expected, result in zip(whole, chunked):
+            assert result['norad_id'] == expected['norad_id']
+            assert result['tle_lines'] == expected['tle_lines']
+            assert result['dataframe'].equals(expected['dataframe'])
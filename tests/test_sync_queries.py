@@ -0,0 +1,183 @@
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import unquote
+from PySide6.QtCore import QSettings, Qt
+from backend.tle.spacetrack_fetcher import build_sync_queries, QueryAssembler, SpaceTrackSyncFetcher
+from backend.tle.parser import iter_tle_groups
+from backend.utils.auth_config import AuthConfig
+from backend.utils.spacetrack import SpaceTrackSessionManager
+import numpy as np
+import pytest
+import re
+
+
+BASE_URL = 'https://www.space-track.org'
+
+LINE1 = '1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927'
+LINE2 = '2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537'
+
+
+def make_tle(norad_id, epoch):
+    day = (epoch - datetime(epoch.year, 1, 1)).total_seconds() / 86400 + 1
+    epoch_field = f'{epoch.year % 100:02d}{day:012.8f}'
+    return (f'{LINE1[:2]}{norad_id}{LINE1[7:18]}{epoch_field}{LINE1[32:]}',
+            f'{LINE2[:2]}{norad_id}{LINE2[7:]}')
+
+
+def fake_response(url, history):
+    # Answers a gp_history query the way Space-Track does: the requested
+    # objects' records after the EPOCH bound, ordered by object and epoch.
+    url = unquote(url)
+    norad_ids = re.search(r'NORAD_CAT_ID/([\d,]+)/', url).group(1).split(',')
+    since = datetime.strptime(re.search(r'EPOCH/>([^/]+)/', url).group(1), '%Y-%m-%dT%H:%M:%S.%f')
+
+    records = sorted((norad_id, epoch) for norad_id, epoch in history
+                     if norad_id in norad_ids and epoch > since)
+    return [line for norad_id, epoch in records for line in make_tle(norad_id, epoch)]
+
+
+def test_stale_object_gets_its_own_query():
+    now = datetime(2024, 3, 1)
+    since_epochs = {
+        '10001': now,
+        '10002': now + timedelta(hours=12),
+        '10003': now - timedelta(days=30)
+    }
+
+    queries = build_sync_queries(BASE_URL, since_epochs)
+
+    assert len(queries) == 2
+    assert 'NORAD_CAT_ID/10003/EPOCH/%3E2024-01-31T00:00:00.000000/' in queries[0][0]
+    assert 'NORAD_CAT_ID/10001,10002/EPOCH/%3E2024-03-01T00:00:00.000000/' in queries[1][0]
+
+
+def test_sync_does_not_emit_element_sets_already_held():
+    now = datetime(2024, 3, 1)
+    since_epochs = {
+        '10001': now,
+        '10002': now + timedelta(hours=12),
+        '10003': now - timedelta(days=30)
+    }
+    history = [(norad_id, now - timedelta(days=40) + timedelta(hours=6 * step))
+               for norad_id in since_epochs for step in range(200)]
+
+    emitted = []
+    assembler = QueryAssembler(build_sync_queries(BASE_URL, since_epochs), since_epochs, emitted.append)
+    returned = []
+    for index, url in enumerate(assembler.urls):
+        lines = fake_response(url, history)
+        returned.extend(lines[::2])
+        assembler.add_response(index, list(iter_tle_groups(lines)))
+
+    # 10002 shares a band with the older 10001, so the response does carry
+    # sets it already has; they must be dropped rather than emitted again.
+    held = [line for line in returned if line[2:7] == '10002' and line[18:32] <= '24061.50000000']
+    assert held
+
+    assert sorted(result['norad_id'] for result in emitted) == sorted(since_epochs)
+    for result in emitted:
+        since = np.datetime64(since_epochs[result['norad_id']], 'us')
+        assert (result['dataframe']['time'] > since).all()
+
+        expected = [epoch for norad_id, epoch in history
+                    if norad_id == result['norad_id'] and epoch > since_epochs[norad_id]]
+        assert len(result['tle_lines']) == len(expected)
+
+
+class FakeSpaceTrack(BaseHTTPRequestHandler):
+    # Logs in by cookie like Space-Track, and expires the session on the
+    # first query so the client has to log in again.
+    history = []
+    logins = 0
+    expired = False
+    queries = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b'', headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path != '/ajaxauth/login':
+            self._send(404)
+            return
+        FakeSpaceTrack.logins += 1
+        self._send(200, b'""', [('Set-Cookie', f'chocolatechip=session{FakeSpaceTrack.logins}; Path=/')])
+
+    def do_GET(self):
+        cookie = self.headers.get('Cookie') or ''
+        if not FakeSpaceTrack.expired:
+            FakeSpaceTrack.expired = True
+            self._send(401)
+            return
+        if f'chocolatechip=session{FakeSpaceTrack.logins}' not in cookie:
+            self._send(401)
+            return
+
+        FakeSpaceTrack.queries.append(self.path)
+        lines = fake_response(self.path, FakeSpaceTrack.history)
+        self._send(200, ''.join(f'{line}\n' for line in lines).encode('ascii'))
+
+
+@pytest.fixture
+def space_track(tmp_path):
+    QSettings.setPath(QSettings.Format.NativeFormat, QSettings.Scope.UserScope, str(tmp_path))
+    FakeSpaceTrack.logins = 0
+    FakeSpaceTrack.expired = False
+    FakeSpaceTrack.queries = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeSpaceTrack)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    settings = AuthConfig().settings
+    settings.setValue('base_url', f'http://127.0.0.1:{server.server_port}/')
+    settings.setValue('email', 'user@example.com')
+    settings.setValue('password', 'secret')
+    SpaceTrackSessionManager().logout()
+
+    yield FakeSpaceTrack
+
+    SpaceTrackSessionManager().logout()
+    settings.clear()
+    settings.sync()
+    server.shutdown()
+    server.server_close()
+
+
+def test_sync_fetcher_against_local_server(space_track):
+    now = datetime(2024, 3, 1)
+    since_epochs = {
+        '10001': now,
+        '10002': now + timedelta(hours=12),
+        '10003': now - timedelta(days=30)
+    }
+    space_track.history = [(norad_id, now - timedelta(days=40) + timedelta(hours=6 * step))
+                           for norad_id in since_epochs for step in range(200)]
+
+    fetcher = SpaceTrackSyncFetcher(since_epochs)
+    emitted = []
+    completed = []
+    # Objects are emitted from the download workers; run() is called here
+    # directly, so the signals must not wait for an event loop.
+    fetcher.object_ready.connect(emitted.append, Qt.ConnectionType.DirectConnection)
+    fetcher.fetch_complete.connect(lambda ok, message: completed.append((ok, message)),
+                                   Qt.ConnectionType.DirectConnection)
+    fetcher.run()
+
+    assert completed == [(True, 'Success')]
+    assert space_track.logins == 2
+    assert len(space_track.queries) == 2
+    assert all(query.startswith('/basicspacedata/query/class/gp_history/') for query in space_track.queries)
+
+    assert sorted(result['norad_id'] for result in emitted) == sorted(since_epochs)
+    for result in emitted:
+        expected = [make_tle(result['norad_id'], epoch) for norad_id, epoch in space_track.history
+                    if norad_id == result['norad_id'] and epoch > since_epochs[norad_id]]
+        assert result['tle_lines'] == expected
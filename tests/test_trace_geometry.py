@@ -0,0 +1,60 @@
+from backend.propagator.trace_geometry import build_trace_path, decimate_path
+import numpy as np
+
+
+VIEW = ((-180.0, 180.0), (-90.0, 90.0), 900, 450)
+
+
+def leo_ground_track(days, step_seconds):
+    # A ground-track-like path: a 92 minute, 51.6 degree inclined orbit
+    # drifting west as the Earth turns underneath it.
+    t = np.arange(0.0, days * 86400.0, step_seconds)
+    phase = 2.0 * np.pi * t / 5520.0
+    latitudes = np.degrees(np.arcsin(np.sin(np.radians(51.6)) * np.sin(phase)))
+    longitudes = (np.degrees(phase) - 360.0 * t / 86164.0 + 180.0) % 360.0 - 180.0
+    return build_trace_path(longitudes, latitudes)
+
+
+def distance_to_polyline(px, py, qx, qy):
+    ax, ay, bx, by = qx[:-1], qy[:-1], qx[1:], qy[1:]
+    segments = np.isfinite(ax) & np.isfinite(bx)
+    ax, ay, bx, by = ax[segments], ay[segments], bx[segments], by[segments]
+
+    dx, dy = bx - ax, by - ay
+    length_sq = np.where(dx * dx + dy * dy == 0, 1.0, dx * dx + dy * dy)
+    t = np.clip(((px[:, None] - ax) * dx + (py[:, None] - ay) * dy) / length_sq, 0.0, 1.0)
+    return np.hypot(px[:, None] - (ax + t * dx), py[:, None] - (ay + t * dy)).min(axis=1)
+
+
+def test_dense_path_output_is_bounded_by_the_view():
+    x10, y10 = leo_ground_track(10, 10)
+    x2, y2 = leo_ground_track(10, 2)
+
+    out10, _ = decimate_path(x10, y10, *VIEW)
+    out2, _ = decimate_path(x2, y2, *VIEW)
+
+    # Five times the samples must not mean more vertices to draw.
+    assert len(x10) > 80000 and len(x2) > 400000
+    assert len(out10) < len(x10) / 10
+    assert len(out2) < len(out10) * 1.1
+
+
+def test_simplified_path_stays_within_a_pixel():
+    x, y = leo_ground_track(0.25, 10)
+    out_x, out_y = decimate_path(x, y, *VIEW)
+
+    scale = VIEW[2] / 360.0
+    finite = np.isfinite(x)
+    error = distance_to_polyline(x[finite] * scale, y[finite] * scale, out_x * scale, out_y * scale)
+
+    assert error.max() <= 1.0
+    assert np.isnan(out_x).sum() == np.isnan(x).sum()
+
+
+def test_zoomed_view_keeps_only_visible_samples():
+    x, y = leo_ground_track(10, 10)
+    out_x, out_y = decimate_path(x, y, (0.0, 20.0), (0.0, 10.0), 900, 450)
+
+    assert len(out_x) < 2000
+    inside = (out_x >= 0) & (out_x <= 20) & (out_y >= 0) & (out_y <= 10)
+    assert inside.any()
@@ -0,0 +1,121 @@
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                                QPushButton, QMessageBox, QProgressBar)
+from backend.tle.spacetrack_fetcher import create_sync_fetcher
+
+
+class SpaceTrackSyncDialog(QDialog):
+
+    def __init__(self, since_epochs, parent=None):
+        super().__init__(parent)
+        self.since_epochs = since_epochs
+        self.fetcher_thread = None
+        self.tle_data = None
+        self.results = []
+        
+        self.setWindowTitle("Sync from Space-Track")
+        self.setModal(True)
+        self.setMinimumWidth(500)
+        
+        self._setup_ui()
+        
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(20)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        title = QLabel("Sync TLE Data from Space-Track")
+        title.setStyleSheet("font-size: 16px; font-weight: bold;")
+        layout.addWidget(title)
+        
+        instructions = QLabel(
+            f"Fetch element sets newer than the latest stored epoch for "
+            f"{len(self.since_epochs)} loaded object(s)."
+        )
+        instructions.setWordWrap(True)
+        instructions.setStyleSheet("color: gray;")
+        layout.addWidget(instructions)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        
+        self.status_label = QLabel("")
+        self.status_label.setWordWrap(True)
+        self.status_label.setMinimumHeight(20)
+        layout.addWidget(self.status_label)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setMinimumWidth(80)
+        self.cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_button)
+        
+        self.sync_button = QPushButton("Sync")
+        self.sync_button.setMinimumWidth(80)
+        self.sync_button.setDefault(True)
+        self.sync_button.setEnabled(bool(self.since_epochs))
+        self.sync_button.clicked.connect(self._on_sync_clicked)
+        button_layout.addWidget(self.sync_button)
+        
+        layout.addLayout(button_layout)
+        
+    def _on_sync_clicked(self):
+        self._set_inputs_enabled(False)
+        self.progress_bar.setVisible(True)
+        self.status_label.setText("Starting sync...")
+        self.status_label.setStyleSheet("font-weight: bold; color: #1976D2;")
+        
+        self.fetcher_thread = create_sync_fetcher(self.since_epochs)
+        self.results = []
+        self.fetcher_thread.progress_update.connect(self._on_progress_update)
+        self.fetcher_thread.object_ready.connect(self._on_object_ready)
+        self.fetcher_thread.fetch_complete.connect(self._on_fetch_complete)
+        self.fetcher_thread.start()
+        
+    def _on_progress_update(self, message):
+        self.status_label.setText(message)
+        
+    def _on_object_ready(self, result):
+        self.results.append(result)
+        
+    def _on_fetch_complete(self, success, message):
+        self.progress_bar.setVisible(False)
+        self._set_inputs_enabled(True)
+        
+        if success:
+            self.tle_data = self.results
+            self.status_label.setText(message)
+            self.status_label.setStyleSheet("font-weight: bold; color: #2E7D32;")
+            
+            success_message = "TLE data synced successfully!"
+            if self.fetcher_thread.backend_notice:
+                success_message += f"\n\n{self.fetcher_thread.backend_notice}"
+            QMessageBox.information(
+                self,
+                "Success",
+                success_message
+            )
+            
+            self.accept()
+        else:
+            self.status_label.setText(message)
+            self.status_label.setStyleSheet("font-weight: bold; color: #C62828;")
+        
+        if self.fetcher_thread:
+            self.fetcher_thread.stop()
+            self.fetcher_thread = None
+    
+    def _set_inputs_enabled(self, enabled):
+        self.sync_button.setEnabled(enabled and bool(self.since_epochs))
+        self.cancel_button.setEnabled(enabled)
+    
+    def get_tle_data(self):
+        return self.tle_data
+    
+    def closeEvent(self, event):
+        if self.fetcher_thread and self.fetcher_thread.isRunning():
+            self.fetcher_thread.stop()
+        event.accept()
@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                 QProgressBar, QFormLayout, QGroupBox)
 from PySide6.QtCore import Qt, QDate
 from datetime import datetime
-from backend.tle.spacetrack_fetcher import SpaceTrackTLEFetcher
+from backend.tle.spacetrack_fetcher import create_tle_fetcher
 
 
 class SpaceTrackTLEDialog(QDialog):
@@ -12,6 +12,7 @@ class SpaceTrackTLEDialog(QDialog):
         super().__init__(parent)
         self.fetcher_thread = None
         self.tle_data = None
+        self.results = []
         
         self.setWindowTitle("Fetch TLE from Space-Track")
         self.setModal(True)
@@ -125,27 +126,35 @@ class SpaceTrackTLEDialog(QDialog):
         self.status_label.setText("Starting fetch...")
         self.status_label.setStyleSheet("font-weight: bold; color: #1976D2;")
         
-        self.fetcher_thread = SpaceTrackTLEFetcher(norad_ids, start, end)
+        self.fetcher_thread = create_tle_fetcher(norad_ids, start, end)
+        self.results = []
         self.fetcher_thread.progress_update.connect(self._on_progress_update)
+        self.fetcher_thread.object_ready.connect(self._on_object_ready)
         self.fetcher_thread.fetch_complete.connect(self._on_fetch_complete)
         self.fetcher_thread.start()
         
     def _on_progress_update(self, message):
         self.status_label.setText(message)
         
-    def _on_fetch_complete(self, success, message, tle_data):
+    def _on_object_ready(self, result):
+        self.results.append(result)
+        
+    def _on_fetch_complete(self, success, message):
         self.progress_bar.setVisible(False)
         self._set_inputs_enabled(True)
         
         if success:
-            self.tle_data = tle_data
+            self.tle_data = self.results
             self.status_label.setText(message)
             self.status_label.setStyleSheet("font-weight: bold; color: #2E7D32;")
             
+            success_message = "TLE data fetched successfully!"
+            if self.fetcher_thread.backend_notice:
+                success_message += f"\n\n{self.fetcher_thread.backend_notice}"
             QMessageBox.information(
                 self,
                 "Success",
-                "TLE data fetched successfully!"
+                success_message
             )
             
             self.accept()
@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QMainWindow, QWidget, QHBoxLayout
+from PySide6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QMessageBox
 from PySide6.QtCore import Signal
 from PySide6.QtGui import QAction
 from ui.sidebar import Sidebar
@@ -6,12 +6,16 @@ from ui.tab_manager import TabManager
 from ui.dialogs.rename_dialog import RenameDialog
 from ui.dialogs.delete_confirm_dialog import DeleteConfirmDialog
 from ui.dialogs.spacetrack_tle_dialog import SpaceTrackTLEDialog
+from ui.dialogs.spacetrack_sync_dialog import SpaceTrackSyncDialog
 from backend.utils.file_handler import open_tle_file
+from backend.utils.auth_config import AuthConfig
+from backend.tle import async_fetcher
 
 
 class MainWindow(QMainWindow):
     load_tle_requested = Signal(str)
-    load_spacetrack_tle_requested = Signal(str)
+    load_spacetrack_tle_requested = Signal(object)
+    sync_spacetrack_requested = Signal()
     rename_requested = Signal(str, str)
     table_requested = Signal(str)
     plot_requested = Signal(str)
@@ -59,6 +63,11 @@ class MainWindow(QMainWindow):
         self.insert_spacetrack.setEnabled(False)  # Disabled until logged in
         insert_menu.addAction(self.insert_spacetrack)
 
+        self.sync_spacetrack = QAction("Sync from SpaceTrack", self)
+        self.sync_spacetrack.triggered.connect(self.sync_spacetrack_requested.emit)
+        self.sync_spacetrack.setEnabled(False)  # Disabled until logged in
+        insert_menu.addAction(self.sync_spacetrack)
+
         # Login menu
         login_menu = menubar.addMenu("Login")
         self.login_action = QAction("Login to Space-Track", self)
@@ -68,6 +77,18 @@ class MainWindow(QMainWindow):
         self.logout_action.setVisible(False)
         login_menu.addAction(self.logout_action)
 
+        # Stored as the fetch_backend setting, read when a download starts.
+        login_menu.addSeparator()
+        self.asyncio_downloads_action = QAction("Use Asyncio Downloads", self)
+        self.asyncio_downloads_action.setCheckable(True)
+        if async_fetcher.is_available():
+            self.asyncio_downloads_action.setChecked(AuthConfig().get_fetch_backend() == 'asyncio')
+        else:
+            self.asyncio_downloads_action.setText("Use Asyncio Downloads (requires httpx)")
+            self.asyncio_downloads_action.setEnabled(False)
+        self.asyncio_downloads_action.toggled.connect(self._on_asyncio_downloads_toggled)
+        login_menu.addAction(self.asyncio_downloads_action)
+
     def _connect_signals(self):
         self.sidebar.rename_requested.connect(self._on_rename_requested)
         self.sidebar.table_requested.connect(self.table_requested.emit)
@@ -78,6 +99,9 @@ class MainWindow(QMainWindow):
         self.sidebar.export_csv_requested.connect(self.export_csv_requested.emit)
         self.sidebar.export_tle_requested.connect(self.export_tle_requested.emit)
 
+    def _on_asyncio_downloads_toggled(self, checked):
+        AuthConfig().set_fetch_backend('asyncio' if checked else 'thread')
+
     def _on_insert_local_tle(self):
         filepath = open_tle_file()
         if filepath:
@@ -90,6 +114,12 @@ class MainWindow(QMainWindow):
             if tle_data:
                 self.load_spacetrack_tle_requested.emit(tle_data)
 
+    def open_sync_dialog(self, since_epochs):
+        dialog = SpaceTrackSyncDialog(since_epochs, self)
+        if dialog.exec():
+            return dialog.get_tle_data()
+        return None
+
     def _on_rename_requested(self, satellite_id):
         current_name = self.sidebar.get_satellite_name(satellite_id)
         dialog = RenameDialog(current_name, self)
@@ -114,6 +144,13 @@ class MainWindow(QMainWindow):
         self.sidebar.remove_satellite_item(satellite_id)
         self.tab_manager.close_tabs_for_satellite(satellite_id)
 
+    def show_archive_error(self, message):
+        QMessageBox.warning(
+            self,
+            "Archive Error",
+            f"TLE data could not be saved to the archive and will be lost on exit:\n{message}"
+        )
+
     def show_satellite_table(self, satellite_id, name, dataframe):
         self.tab_manager.create_tabular_tab(satellite_id, name, dataframe)
     
@@ -86,6 +86,7 @@ class TabManager(QWidget):
         self.tab_widget.removeTab(index)
         if tab_key:
             del self.tabs[tab_key]
+        self._shutdown_widget(widget)
 
     def close_tabs_for_satellite(self, satellite_id):
         tabs_to_remove = [k for k, v in self.tabs.items() if v['satellite_id'] == satellite_id]
@@ -96,6 +97,11 @@ class TabManager(QWidget):
             if index >= 0:
                 self.tab_widget.removeTab(index)
             del self.tabs[tab_key]
+            self._shutdown_widget(widget)
+
+    def _shutdown_widget(self, widget):
+        if hasattr(widget, 'shutdown'):
+            widget.shutdown()
 
     def update_tab_names(self, satellite_id, new_name):
         for tab_key, tab_info in list(self.tabs.items()):
@@ -0,0 +1,141 @@
+from PySide6.QtCore import QTimer
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import PathPatch
+from collections import OrderedDict
+import numpy as np
+
+
+OCEAN_COLOR = '#2c5f8d'
+LAND_COLOR = '#4a4a4a'
+COASTLINE_COLOR = 'black'
+COASTLINE_WIDTH = 0.3
+
+MAX_CACHED_IMAGES = 16
+REFRESH_DELAY_MS = 150
+
+# Rendered basemaps are shared by every open map tab; tabs in the same
+# QTabWidget have the same canvas size, so they all hit the same entry.
+_image_cache = OrderedDict()
+
+
+def _land_patch(world, **kwargs):
+    return PathPatch(world, facecolor=LAND_COLOR, edgecolor=COASTLINE_COLOR,
+                     linewidth=COASTLINE_WIDTH, **kwargs)
+
+
+def render_basemap(world, width, height, xlim, ylim):
+    figure = Figure(figsize=(width / 100, height / 100), dpi=100, facecolor=OCEAN_COLOR)
+    canvas = FigureCanvasAgg(figure)
+
+    ax = figure.add_axes([0, 0, 1, 1])
+    ax.set_axis_off()
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+    ax.add_artist(_land_patch(world))
+
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def get_basemap_image(world, width, height, xlim, ylim):
+    key = (id(world), width, height, xlim, ylim)
+
+    image = _image_cache.get(key)
+    if image is not None:
+        _image_cache.move_to_end(key)
+        return image
+
+    image = render_basemap(world, width, height, xlim, ylim)
+    _image_cache[key] = image
+    while len(_image_cache) > MAX_CACHED_IMAGES:
+        _image_cache.popitem(last=False)
+    return image
+
+
+class BasemapLayer:
+
+    def __init__(self, ax, canvas):
+        self.ax = ax
+        self.canvas = canvas
+        self.world = None
+        self.image = None
+        self.key = None
+        self.export_patch = None
+
+        # Pans and resizes stretch the current image until they settle.
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(REFRESH_DELAY_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        self.connections = [
+            (canvas, canvas.mpl_connect('resize_event', self._schedule_refresh)),
+            (ax.callbacks, ax.callbacks.connect('xlim_changed', self._schedule_refresh)),
+            (ax.callbacks, ax.callbacks.connect('ylim_changed', self._schedule_refresh))
+        ]
+
+    def set_world(self, world):
+        self.world = world
+        self.key = None
+        self.refresh()
+
+    def _schedule_refresh(self, *args):
+        if self.world is not None:
+            self.refresh_timer.start()
+
+    def refresh(self):
+        if self.world is None:
+            return
+
+        # Size the image to the axes box as drawn, after the equal aspect
+        # shrinks it to fit.
+        self.ax.apply_aspect()
+        bbox = self.ax.get_window_extent()
+        width, height = int(round(bbox.width)), int(round(bbox.height))
+        if width <= 0 or height <= 0:
+            return
+
+        xlim = tuple(float(x) for x in self.ax.get_xlim())
+        ylim = tuple(float(y) for y in self.ax.get_ylim())
+        key = (width, height, xlim, ylim)
+        if key == self.key:
+            return
+        self.key = key
+
+        image = get_basemap_image(self.world, width, height, xlim, ylim)
+        extent = (xlim[0], xlim[1], ylim[0], ylim[1])
+
+        if self.image is None:
+            self.image = self.ax.imshow(image, extent=extent, origin='upper', zorder=0,
+                                        interpolation='nearest')
+            self.ax.set_xlim(xlim)
+            self.ax.set_ylim(ylim)
+        else:
+            self.image.set_data(image)
+            self.image.set_extent(extent)
+
+        self.canvas.draw_idle()
+
+    def begin_export(self):
+        # Saved figures get the vector coastline at the export resolution.
+        if self.image is None:
+            return
+        self.image.set_visible(False)
+        self.export_patch = self.ax.add_artist(_land_patch(self.world, rasterized=True))
+
+    def end_export(self):
+        if self.export_patch is None:
+            return
+        self.export_patch.remove()
+        self.export_patch = None
+        self.image.set_visible(True)
+
+    def disconnect(self):
+        self.refresh_timer.stop()
+        for source, connection in self.connections:
+            if source is self.canvas:
+                self.canvas.mpl_disconnect(connection)
+            else:
+                source.disconnect(connection)
+        self.connections = []
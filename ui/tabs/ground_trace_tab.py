@@ -1,10 +1,15 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-                               QPushButton, QSlider, QGroupBox)
+                               QPushButton, QSlider, QGroupBox, QProgressBar, QMessageBox)
 from PySide6.QtCore import Qt, QTimer
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
 from backend.utils.map_loader import MapLoader
+from backend.propagator.time_lookup import ns_to_datetime
+from ui.tabs.basemap_layer import BasemapLayer, OCEAN_COLOR
+from ui.tabs.playback_blitter import PlaybackBlitter
 from ui.dialogs.ground_trace_settings_dialog import GroundTraceSettingsDialog
 import numpy as np
 
@@ -21,6 +26,8 @@ class GroundTraceWidget(QWidget):
         self.ground_trace_data = ground_trace_data
         self.ground_trace_controller = ground_trace_controller
         self.trajectory = None
+        self.ground_trace = None
+        self.compute_job = None
         self.current_index = 0
         self.is_playing = False
 
@@ -36,8 +43,16 @@ class GroundTraceWidget(QWidget):
             'segment_visibility': [True, True, True]
         }
 
+        # Connect before checking, so a load finishing in between still
+        # reaches this tab.
         map_loader = MapLoader()
+        map_loader.signals.map_loaded.connect(self._on_world_map_loaded)
         self.world = map_loader.get_world_map()
+        self.waiting_for_map = self.world is None
+        if self.waiting_for_map:
+            map_loader.load_world_map_async()
+        else:
+            map_loader.signals.map_loaded.disconnect(self._on_world_map_loaded)
 
         self._setup_ui()
         self._setup_timer()
@@ -61,11 +76,18 @@ class GroundTraceWidget(QWidget):
         layout.addWidget(self.toolbar)
         layout.addWidget(self.canvas)
 
+        self.basemap = BasemapLayer(self.ax, self.canvas)
         self._draw_world_map()
 
     def _custom_savefig(self, *args, **kwargs):
         kwargs['dpi'] = 300
-        return Figure.savefig(self.figure, *args, **kwargs)
+        self.basemap.begin_export()
+        self.blitter.begin_export()
+        try:
+            return Figure.savefig(self.figure, *args, **kwargs)
+        finally:
+            self.blitter.end_export()
+            self.basemap.end_export()
 
     def _create_controls(self):
         main_controls = QVBoxLayout()
@@ -101,6 +123,12 @@ class GroundTraceWidget(QWidget):
         self.compute_button.setMaximumWidth(80)
         layout.addWidget(self.compute_button)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumWidth(120)
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
         layout.addWidget(QLabel("Current Time:"))
         self.current_time_input = QLineEdit("--")
         self.current_time_input.setMaximumWidth(150)
@@ -144,6 +172,10 @@ class GroundTraceWidget(QWidget):
         self.reset_button.setMaximumWidth(70)
         layout.addWidget(self.reset_button)
 
+        self.fps_label = QLabel("FPS: --")
+        self.fps_label.setMinimumWidth(70)
+        layout.addWidget(self.fps_label)
+
         self.settings_button = QPushButton("⚙ Settings")
         self.settings_button.clicked.connect(self._open_settings)
         self.settings_button.setMaximumWidth(90)
@@ -160,12 +192,7 @@ class GroundTraceWidget(QWidget):
         self.timer.setInterval(100)
 
     def _draw_world_map(self):
-        self.ax.clear()
-
-        if self.world is not None:
-            self.world.plot(ax=self.ax, color='#4a4a4a', edgecolor='black', linewidth=0.3, rasterized=True)
-        
-        self.ax.set_facecolor('#2c5f8d')
+        self.ax.set_facecolor(OCEAN_COLOR)
         for lat in range(-90, 91, 30):
             self.ax.axhline(y=lat, color='gray', linewidth=0.3, alpha=0.3)
         for lon in range(-180, 181, 30):
@@ -173,21 +200,44 @@ class GroundTraceWidget(QWidget):
 
         self.ax.set_xlim(-180, 180)
         self.ax.set_ylim(-90, 90)
+        self.ax.set_aspect('equal')
         self.ax.set_title(f"Ground Trace: {self.ground_trace_data['name']}")
         self.ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
 
+        # The trace artists live for the lifetime of the widget; redraws only
+        # update their data and style.
+        self.trace_collection = LineCollection([], alpha=0.7)
+        self.ax.add_collection(self.trace_collection, autolim=False)
+        self.satellite_marker, = self.ax.plot([], [], 'o', markersize=10)
+        self.time_text = self.ax.text(0.01, 0.02, '', transform=self.ax.transAxes, color='white',
+                                      fontsize=9, bbox=dict(facecolor='black', alpha=0.5, edgecolor='none'))
+        self.blitter = PlaybackBlitter(self.canvas, [self.satellite_marker, self.time_text])
+        self.satellite_marker.set_color(self.settings['marker_color'])
+
+        if self.world is not None:
+            self.basemap.set_world(self.world)
+
         self.canvas.draw()
 
+    def _on_world_map_loaded(self, world):
+        self._stop_waiting_for_map()
+        self.world = world
+        if self.world is not None:
+            self.basemap.set_world(self.world)
+
+    def _stop_waiting_for_map(self):
+        if self.waiting_for_map:
+            MapLoader().signals.map_loaded.disconnect(self._on_world_map_loaded)
+            self.waiting_for_map = False
+
     def _open_settings(self):
         dialog = GroundTraceSettingsDialog(self.settings, self)
         if dialog.exec():
             self.settings = dialog.get_settings()
+            self.satellite_marker.set_color(self.settings['marker_color'])
             if self.trajectory:
                 self._draw_trajectory()
-                lon = self.trajectory['longitudes'][self.current_index]
-                lat = self.trajectory['latitudes'][self.current_index]
-                self.satellite_marker.set_data([lon], [lat])
-                self.canvas.draw()
+            self.canvas.draw_idle()
 
     def _compute_trajectory(self):
         start_time_str = self.start_time_input.text()
@@ -202,7 +252,9 @@ class GroundTraceWidget(QWidget):
         interval1_minutes = self.settings['interval1_minutes']
         interval2_minutes = self.settings['interval2_minutes']
 
-        self.trajectory = self.ground_trace_controller.compute_ground_trace(
+        self._cancel_compute()
+
+        self.compute_job = self.ground_trace_controller.submit_ground_trace(
             self.ground_trace_data['tle_line1'],
             self.ground_trace_data['tle_line2'],
             start_time,
@@ -211,8 +263,39 @@ class GroundTraceWidget(QWidget):
             interval2_minutes,
             step_seconds=60
         )
+        self.compute_job.signals.progress.connect(self.progress_bar.setValue)
+        self.compute_job.signals.finished.connect(self._on_trajectory_ready)
+        self.compute_job.signals.failed.connect(self._on_compute_failed)
+
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
 
-        self.current_index = self.trajectory['midpoint_index']
+    def _cancel_compute(self):
+        if self.compute_job is None:
+            return
+
+        self.compute_job.cancel()
+        self.compute_job.signals.progress.disconnect(self.progress_bar.setValue)
+        self.compute_job.signals.finished.disconnect(self._on_trajectory_ready)
+        self.compute_job.signals.failed.disconnect(self._on_compute_failed)
+        self.compute_job = None
+        self.progress_bar.setVisible(False)
+
+    def _on_compute_failed(self, message):
+        self.compute_job = None
+        self.progress_bar.setVisible(False)
+        QMessageBox.warning(self, "Ground Trace Failed", message)
+
+    def _on_trajectory_ready(self, ground_trace):
+        self.compute_job = None
+        self.progress_bar.setVisible(False)
+
+        if self.is_playing:
+            self._toggle_playback()
+
+        self.ground_trace = ground_trace
+        self.trajectory = ground_trace['trajectory']
+        self.current_index = self.ground_trace['midpoint_index']
         self.play_button.setEnabled(True)
         self.step_slider.setEnabled(True)
         self.reset_button.setEnabled(True)
@@ -221,52 +304,34 @@ class GroundTraceWidget(QWidget):
         self._draw_trajectory()
         self._update_time_display()
 
-        lon = self.trajectory['longitudes'][self.current_index]
-        lat = self.trajectory['latitudes'][self.current_index]
+        lon = self.trajectory.longitudes[self.current_index]
+        lat = self.trajectory.latitudes[self.current_index]
         self.satellite_marker.set_data([lon], [lat])
         self.canvas.draw()
 
     def _draw_trajectory(self):
-        self._draw_world_map()
+        lines = self.ground_trace['trace_lines']
+        segments = self.ground_trace['trace_segments']
 
-        lons = self.trajectory['longitudes']
-        lats = self.trajectory['latitudes']
-        segments = self.trajectory['segments']
-
-        from matplotlib.collections import LineCollection
-
-        points = []
-        colors = []
-        
-        for i in range(len(lons) - 1):
-            if abs(lons[i+1] - lons[i]) > 180:
-                continue
-            
-            seg_idx = segments[i]
-            if not self.settings['segment_visibility'][seg_idx]:
-                continue
-            
-            points.append([(lons[i], lats[i]), (lons[i+1], lats[i+1])])
-            colors.append(self.settings['segment_colors'][seg_idx])
-        
-        if points:
-            lc = LineCollection(points, colors=colors, linewidths=self.settings['thickness'], alpha=0.7)
-            self.ax.add_collection(lc)
-
-        self.satellite_marker, = self.ax.plot([], [], 'o', 
-                                              color=self.settings['marker_color'], 
-                                              markersize=10)
-        self.canvas.draw()
+        visible = np.asarray(self.settings['segment_visibility'], dtype=bool)[segments]
+        palette = to_rgba_array(self.settings['segment_colors'])
+
+        self.trace_collection.set_segments(lines[visible])
+        self.trace_collection.set_colors(palette[segments[visible]])
+        self.trace_collection.set_linewidth(self.settings['thickness'])
+        self.satellite_marker.set_color(self.settings['marker_color'])
 
     def _toggle_playback(self):
         if self.is_playing:
             self.is_playing = False
             self.play_button.setText("▶ Play")
             self.timer.stop()
+            self.fps_label.setText("FPS: --")
             self.current_time_input.setReadOnly(False)
         else:
             self.is_playing = True
             self.play_button.setText("⏸ Pause")
+            self.blitter.reset_fps()
             self.timer.start()
             self.current_time_input.setReadOnly(True)
 
@@ -274,25 +339,29 @@ class GroundTraceWidget(QWidget):
         if self.trajectory is None:
             return
 
-        self.current_index = self.trajectory['midpoint_index']
+        self.current_index = self.ground_trace['midpoint_index']
         if self.is_playing:
             self.is_playing = False
             self.play_button.setText("▶ Play")
             self.timer.stop()
+            self.fps_label.setText("FPS: --")
             self.current_time_input.setReadOnly(False)
 
-        lon = self.trajectory['longitudes'][self.current_index]
-        lat = self.trajectory['latitudes'][self.current_index]
+        lon = self.trajectory.longitudes[self.current_index]
+        lat = self.trajectory.latitudes[self.current_index]
         self.satellite_marker.set_data([lon], [lat])
         self._update_time_display()
-        self.canvas.draw()
+        self.blitter.update()
 
-    def _update_time_display(self):
+    def _update_time_display(self, current_time=None):
         if self.trajectory is None:
             return
 
-        current_time = self.trajectory['times'][self.current_index]
-        self.current_time_input.setText(current_time.strftime('%Y-%m-%d %H:%M:%S'))
+        if current_time is None:
+            current_time = self.trajectory.time_at(self.current_index)
+        time_str = current_time.strftime('%Y-%m-%d %H:%M:%S')
+        self.current_time_input.setText(time_str)
+        self.time_text.set_text(f"{time_str} UTC")
 
     def _update_animation(self):
         if self.trajectory is None:
@@ -301,15 +370,20 @@ class GroundTraceWidget(QWidget):
         step_size = self.step_slider.value()
         self.current_index += step_size
 
-        if self.current_index >= len(self.trajectory['times']):
+        if self.current_index >= len(self.trajectory):
             self.current_index = 0
 
-        lon = self.trajectory['longitudes'][self.current_index]
-        lat = self.trajectory['latitudes'][self.current_index]
+        lon = self.trajectory.longitudes[self.current_index]
+        lat = self.trajectory.latitudes[self.current_index]
 
         self.satellite_marker.set_data([lon], [lat])
         self._update_time_display()
-        self.canvas.draw_idle()
+        self.blitter.update()
+        self._update_fps_label()
+
+    def _update_fps_label(self):
+        fps = self.blitter.fps()
+        self.fps_label.setText(f"FPS: {fps:.1f}" if fps is not None else "FPS: --")
 
     def _on_time_input_changed(self):
         if self.trajectory is None or self.is_playing:
@@ -319,14 +393,22 @@ class GroundTraceWidget(QWidget):
         target_time = self.ground_trace_controller.parse_time_input(time_str)
 
         if target_time:
-            new_index = self.ground_trace_controller.find_time_index(
-                self.trajectory['times'], 
+            self.current_index = self.ground_trace_controller.find_time_index(
+                self.trajectory, 
                 target_time
             )
-            self.current_index = new_index
-            
-            lon = self.trajectory['longitudes'][self.current_index]
-            lat = self.trajectory['latitudes'][self.current_index]
-            self.satellite_marker.set_data([lon], [lat])
-            self._update_time_display()
-            self.canvas.draw()
+
+            # The marker sits at the typed time rather than the nearest sample.
+            position = self.ground_trace_controller.interpolate_position(self.trajectory, target_time)
+            if position is None:
+                return
+            self.satellite_marker.set_data([position['longitude']], [position['latitude']])
+            self._update_time_display(ns_to_datetime(position['epoch']))
+            self.blitter.update()
+
+    def shutdown(self):
+        self._stop_waiting_for_map()
+        self.basemap.disconnect()
+        self.blitter.disconnect()
+        self._cancel_compute()
+        self.timer.stop()
@@ -0,0 +1,70 @@
+from collections import deque
+import time
+
+
+FPS_WINDOW = 30
+
+
+class PlaybackBlitter:
+
+    def __init__(self, canvas, artists):
+        self.canvas = canvas
+        self.artists = artists
+        self.background = None
+        self.exporting = False
+        self.frame_times = deque(maxlen=FPS_WINDOW)
+
+        # Animated artists are left out of full draws; they are painted on top
+        # of the cached background instead.
+        for artist in self.artists:
+            artist.set_animated(True)
+
+        self.connection = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        if self.exporting:
+            return
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self.artists:
+            self.canvas.figure.draw_artist(artist)
+
+    def update(self):
+        self.frame_times.append(time.perf_counter())
+
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self.background)
+        self._draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def fps(self):
+        if len(self.frame_times) < 2:
+            return None
+        elapsed = self.frame_times[-1] - self.frame_times[0]
+        if elapsed <= 0:
+            return None
+        return (len(self.frame_times) - 1) / elapsed
+
+    def reset_fps(self):
+        self.frame_times.clear()
+
+    def begin_export(self):
+        # Saved figures are drawn in one pass, so they need the artists back.
+        self.exporting = True
+        for artist in self.artists:
+            artist.set_animated(False)
+
+    def end_export(self):
+        for artist in self.artists:
+            artist.set_animated(True)
+        self.exporting = False
+        self.background = None
+        self.canvas.draw_idle()
+
+    def disconnect(self):
+        self.canvas.mpl_disconnect(self.connection)
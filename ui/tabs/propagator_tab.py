@@ -1,11 +1,15 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QSlider, QGroupBox
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QSlider, QGroupBox,
+                               QProgressBar, QMessageBox, QComboBox)
 from PySide6.QtCore import Qt, QTimer
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 from backend.utils.map_loader import MapLoader
+from backend.propagator.trace_geometry import build_trace_path
+from ui.tabs.basemap_layer import BasemapLayer, OCEAN_COLOR
+from ui.tabs.playback_blitter import PlaybackBlitter
+from ui.tabs.trace_lod import TraceLevelOfDetail
 from ui.dialogs.propagator_settings_dialog import PropagatorSettingsDialog
-import numpy as np
 
 
 def create_propagator_widget(propagation_data, propagator_controller):
@@ -20,6 +24,7 @@ class PropagatorWidget(QWidget):
         self.propagation_data = propagation_data
         self.propagator_controller = propagator_controller
         self.trajectory = None
+        self.compute_job = None
         self.current_index = 0
         self.is_playing = False
 
@@ -29,8 +34,16 @@ class PropagatorWidget(QWidget):
             'thickness': 1
         }
 
+        # Connect before checking, so a load finishing in between still
+        # reaches this tab.
         map_loader = MapLoader()
+        map_loader.signals.map_loaded.connect(self._on_world_map_loaded)
         self.world = map_loader.get_world_map()
+        self.waiting_for_map = self.world is None
+        if self.waiting_for_map:
+            map_loader.load_world_map_async()
+        else:
+            map_loader.signals.map_loaded.disconnect(self._on_world_map_loaded)
 
         self._setup_ui()
         self._setup_timer()
@@ -54,11 +67,20 @@ class PropagatorWidget(QWidget):
         layout.addWidget(self.toolbar)
         layout.addWidget(self.canvas)
 
+        self.basemap = BasemapLayer(self.ax, self.canvas)
         self._draw_world_map()
 
     def _custom_savefig(self, *args, **kwargs):
         kwargs['dpi'] = 300
-        return Figure.savefig(self.figure, *args, **kwargs)
+        self.basemap.begin_export()
+        self.blitter.begin_export()
+        self.trace_lod.begin_export()
+        try:
+            return Figure.savefig(self.figure, *args, **kwargs)
+        finally:
+            self.trace_lod.end_export()
+            self.blitter.end_export()
+            self.basemap.end_export()
 
     def _create_controls(self):
         main_controls = QVBoxLayout()
@@ -91,11 +113,22 @@ class PropagatorWidget(QWidget):
         self.stop_time_input.setMaximumWidth(100)
         layout.addWidget(self.stop_time_input)
 
+        layout.addWidget(QLabel("Sampling:"))
+        self.sampling_combo = QComboBox()
+        self.sampling_combo.addItems(["Fixed (60 s)", "Adaptive"])
+        layout.addWidget(self.sampling_combo)
+
         self.compute_button = QPushButton("Compute")
         self.compute_button.clicked.connect(self._compute_trajectory)
         self.compute_button.setMaximumWidth(80)
         layout.addWidget(self.compute_button)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumWidth(120)
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
         layout.addWidget(QLabel("Time:"))
         self.current_time_label = QLabel("--")
         self.current_time_label.setMinimumWidth(150)
@@ -137,6 +170,10 @@ class PropagatorWidget(QWidget):
         self.reset_button.setMaximumWidth(70)
         layout.addWidget(self.reset_button)
 
+        self.fps_label = QLabel("FPS: --")
+        self.fps_label.setMinimumWidth(70)
+        layout.addWidget(self.fps_label)
+
         self.settings_button = QPushButton("⚙ Settings")
         self.settings_button.clicked.connect(self._open_settings)
         self.settings_button.setMaximumWidth(90)
@@ -153,12 +190,7 @@ class PropagatorWidget(QWidget):
         self.timer.setInterval(100)
 
     def _draw_world_map(self):
-        self.ax.clear()
-
-        if self.world is not None:
-            self.world.plot(ax=self.ax, color='#4a4a4a', edgecolor='black', linewidth=0.3, rasterized=True)
-        
-        self.ax.set_facecolor('#2c5f8d')
+        self.ax.set_facecolor(OCEAN_COLOR)
         for lat in range(-90, 91, 30):
             self.ax.axhline(y=lat, color='gray', linewidth=0.3, alpha=0.3)
         for lon in range(-180, 181, 30):
@@ -166,23 +198,70 @@ class PropagatorWidget(QWidget):
 
         self.ax.set_xlim(-180, 180)
         self.ax.set_ylim(-90, 90)
+        self.ax.set_aspect('equal')
         self.ax.set_title(f"SGP4 Propagation: {self.propagation_data['name']}")
         self.ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
 
+        # The trajectory artists live for the lifetime of the widget; redraws
+        # only update their data and style.
+        self.trajectory_line, = self.ax.plot([], [], alpha=0.6)
+        self.trace_lod = TraceLevelOfDetail(self.ax, self.canvas, self.trajectory_line)
+        self.satellite_marker, = self.ax.plot([], [], 'o', markersize=10)
+        self.time_text = self.ax.text(0.01, 0.02, '', transform=self.ax.transAxes, color='white',
+                                      fontsize=9, bbox=dict(facecolor='black', alpha=0.5, edgecolor='none'))
+        self.blitter = PlaybackBlitter(self.canvas, [self.satellite_marker, self.time_text])
+        self._apply_settings()
+
+        if self.world is not None:
+            self.basemap.set_world(self.world)
+
         self.canvas.draw()
 
     def _compute_trajectory(self):
         start_time = self.propagation_data['epoch']
         stop_time_str = self.stop_time_input.text()
 
-        self.trajectory = self.propagator_controller.compute_trajectory(
+        self._cancel_compute()
+
+        self.compute_job = self.propagator_controller.submit_trajectory(
             self.propagation_data['tle_line1'],
             self.propagation_data['tle_line2'],
             start_time,
             stop_time_str,
-            step_seconds=60
+            step_seconds=60,
+            adaptive=self.sampling_combo.currentText() == "Adaptive"
         )
+        self.compute_job.signals.progress.connect(self.progress_bar.setValue)
+        self.compute_job.signals.finished.connect(self._on_trajectory_ready)
+        self.compute_job.signals.failed.connect(self._on_compute_failed)
+
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+
+    def _cancel_compute(self):
+        if self.compute_job is None:
+            return
+
+        self.compute_job.cancel()
+        self.compute_job.signals.progress.disconnect(self.progress_bar.setValue)
+        self.compute_job.signals.finished.disconnect(self._on_trajectory_ready)
+        self.compute_job.signals.failed.disconnect(self._on_compute_failed)
+        self.compute_job = None
+        self.progress_bar.setVisible(False)
 
+    def _on_compute_failed(self, message):
+        self.compute_job = None
+        self.progress_bar.setVisible(False)
+        QMessageBox.warning(self, "Propagation Failed", message)
+
+    def _on_trajectory_ready(self, trajectory):
+        self.compute_job = None
+        self.progress_bar.setVisible(False)
+
+        if self.is_playing:
+            self._toggle_playback()
+
+        self.trajectory = trajectory
         self.current_index = 0
         self.play_button.setEnabled(True)
         self.step_slider.setEnabled(True)
@@ -191,57 +270,51 @@ class PropagatorWidget(QWidget):
         self._draw_trajectory()
         self._update_time_display()
 
-        lon = self.trajectory['longitudes'][0]
-        lat = self.trajectory['latitudes'][0]
+        lon = self.trajectory.longitudes[0]
+        lat = self.trajectory.latitudes[0]
         self.satellite_marker.set_data([lon], [lat])
         self.canvas.draw()
 
     def _draw_trajectory(self):
-        self._draw_world_map()
-
-        lons = self.trajectory['longitudes']
-        lats = self.trajectory['latitudes']
-
-        wrapped_lons = []
-        wrapped_lats = []
-
-        for i in range(len(lons)):
-            if i > 0 and abs(lons[i] - lons[i - 1]) > 180:
-                wrapped_lons.append(np.nan)
-                wrapped_lats.append(np.nan)
-            wrapped_lons.append(lons[i])
-            wrapped_lats.append(lats[i])
-
-        self.trajectory_line, = self.ax.plot(wrapped_lons, wrapped_lats, 
-                                             color=self.settings['trace_color'], 
-                                             linewidth=self.settings['thickness'], 
-                                             alpha=0.6)
-
-        self.satellite_marker, = self.ax.plot([], [], 'o', 
-                                             color=self.settings['marker_color'], 
-                                             markersize=10)
+        # The full-resolution path is kept aside; the line only ever holds
+        # what the current view can show.
+        self.trace_lod.set_path(*build_trace_path(self.trajectory.longitudes,
+                                                  self.trajectory.latitudes))
+        self._apply_settings()
+
+    def _apply_settings(self):
+        self.trajectory_line.set_color(self.settings['trace_color'])
+        self.trajectory_line.set_linewidth(self.settings['thickness'])
+        self.satellite_marker.set_color(self.settings['marker_color'])
+
+    def _on_world_map_loaded(self, world):
+        self._stop_waiting_for_map()
+        self.world = world
+        if self.world is not None:
+            self.basemap.set_world(self.world)
 
-        self.canvas.draw()
+    def _stop_waiting_for_map(self):
+        if self.waiting_for_map:
+            MapLoader().signals.map_loaded.disconnect(self._on_world_map_loaded)
+            self.waiting_for_map = False
 
     def _open_settings(self):
         dialog = PropagatorSettingsDialog(self.settings, self)
         if dialog.exec():
             self.settings = dialog.get_settings()
-            if self.trajectory:
-                self._draw_trajectory()
-                lon = self.trajectory['longitudes'][self.current_index]
-                lat = self.trajectory['latitudes'][self.current_index]
-                self.satellite_marker.set_data([lon], [lat])
-                self.canvas.draw()
+            self._apply_settings()
+            self.canvas.draw_idle()
 
     def _toggle_playback(self):
         if self.is_playing:
             self.is_playing = False
             self.play_button.setText("▶ Play")
             self.timer.stop()
+            self.fps_label.setText("FPS: --")
         else:
             self.is_playing = True
             self.play_button.setText("⸠Pause")
+            self.blitter.reset_fps()
             self.timer.start()
 
     def _reset_animation(self):
@@ -253,19 +326,22 @@ class PropagatorWidget(QWidget):
             self.is_playing = False
             self.play_button.setText("▶ Play")
             self.timer.stop()
+            self.fps_label.setText("FPS: --")
 
-        lon = self.trajectory['longitudes'][0]
-        lat = self.trajectory['latitudes'][0]
+        lon = self.trajectory.longitudes[0]
+        lat = self.trajectory.latitudes[0]
         self.satellite_marker.set_data([lon], [lat])
         self._update_time_display()
-        self.canvas.draw()
+        self.blitter.update()
 
     def _update_time_display(self):
         if self.trajectory is None:
             return
 
-        current_time = self.trajectory['times'][self.current_index]
-        self.current_time_label.setText(current_time.strftime('%Y-%m-%d %H:%M:%S'))
+        current_time = self.trajectory.time_at(self.current_index)
+        time_str = current_time.strftime('%Y-%m-%d %H:%M:%S')
+        self.current_time_label.setText(time_str)
+        self.time_text.set_text(f"{time_str} UTC")
 
     def _update_animation(self):
         if self.trajectory is None:
@@ -274,12 +350,25 @@ class PropagatorWidget(QWidget):
         step_size = self.step_slider.value()
         self.current_index += step_size
 
-        if self.current_index >= len(self.trajectory['times']):
+        if self.current_index >= len(self.trajectory):
             self.current_index = 0
 
-        lon = self.trajectory['longitudes'][self.current_index]
-        lat = self.trajectory['latitudes'][self.current_index]
+        lon = self.trajectory.longitudes[self.current_index]
+        lat = self.trajectory.latitudes[self.current_index]
 
         self.satellite_marker.set_data([lon], [lat])
         self._update_time_display()
-        self.canvas.draw_idle()
\ No newline at end of file
+        self.blitter.update()
+        self._update_fps_label()
+
+    def _update_fps_label(self):
+        fps = self.blitter.fps()
+        self.fps_label.setText(f"FPS: {fps:.1f}" if fps is not None else "FPS: --")
+
+    def shutdown(self):
+        self._stop_waiting_for_map()
+        self.basemap.disconnect()
+        self.blitter.disconnect()
+        self.trace_lod.disconnect()
+        self._cancel_compute()
+        self.timer.stop()
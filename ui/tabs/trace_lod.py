@@ -0,0 +1,70 @@
+from PySide6.QtCore import QTimer
+from backend.propagator.trace_geometry import decimate_path
+import numpy as np
+
+
+class TraceLevelOfDetail:
+
+    def __init__(self, ax, canvas, line):
+        self.ax = ax
+        self.canvas = canvas
+        self.line = line
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.pending = False
+        self.active = True
+        self.view = None
+
+        self.connections = [
+            (canvas, canvas.mpl_connect('resize_event', self._schedule_refresh)),
+            (ax.callbacks, ax.callbacks.connect('xlim_changed', self._schedule_refresh)),
+            (ax.callbacks, ax.callbacks.connect('ylim_changed', self._schedule_refresh))
+        ]
+
+    def set_path(self, x, y):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.view = None
+        self.refresh()
+
+    def _schedule_refresh(self, *args):
+        # A pan changes both limits; decimate once, ahead of the redraw the
+        # toolbar has queued.
+        if not self.pending:
+            self.pending = True
+            QTimer.singleShot(0, self._deferred_refresh)
+
+    def _deferred_refresh(self):
+        self.pending = False
+        if self.active:
+            self.refresh()
+            self.canvas.draw_idle()
+
+    def refresh(self):
+        bbox = self.ax.get_window_extent()
+        view = (self.ax.get_xlim(), self.ax.get_ylim(), bbox.width, bbox.height)
+        # Simplifying a dense trace costs time linear in its visible samples,
+        # so repeated callbacks for an unchanged view reuse the last result.
+        if view == self.view:
+            return
+        self.view = view
+        x, y = decimate_path(self.x, self.y, *view)
+        self.line.set_data(x, y)
+
+    def begin_export(self):
+        # Exports render at a higher resolution than the screen pixels the
+        # decimation was done for.
+        self.line.set_data(self.x, self.y)
+
+    def end_export(self):
+        self.view = None
+        self.refresh()
+
+    def disconnect(self):
+        self.active = False
+        for source, connection in self.connections:
+            if source is self.canvas:
+                self.canvas.mpl_disconnect(connection)
+            else:
+                source.disconnect(connection)
+        self.connections = []